@@ -8,13 +8,18 @@ Cache modes:
     Long cache:
         Long cache have a far greater expiration delay that is reset on access.
         This is useful to store data that will not change.
+
+"MemoryCache" provides a size bounded in memory cache with expiration, used to store
+frequently accessed values like objects headers.
 """
+from collections import OrderedDict
 from gzip import open as open_archive
 from hashlib import blake2b
 from json import load, dump
 from os import listdir, utime, remove, makedirs, chmod
 from os.path import join, getmtime
-from time import time
+from threading import Lock
+from time import time, monotonic
 from airfs._core.config import CACHE_DIR
 
 
@@ -125,3 +130,86 @@ def set_cache(name, obj, long=False):
 
     with open_archive(path, "wt") as file:
         dump(obj, file)
+
+
+class MemoryCache:
+    """
+    Thread safe in memory cache, with expiration and least recently used eviction.
+
+    Args:
+        max_size (int): Maximum number of entries. Least recently used entries are
+            discarded once reached. 0 for no limit.
+        expiry (float): Delay in seconds after which an entry is discarded. 0 for no
+            expiration.
+    """
+
+    __slots__ = ("_entries", "_lock", "max_size", "expiry")
+
+    def __init__(self, max_size=0, expiry=0):
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self.max_size = max_size
+        self.expiry = expiry
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key):
+        """
+        Get a cached value.
+
+        Args:
+            key (hashable object): Cache key.
+
+        Returns:
+            object: Cached value.
+
+        Raises:
+            NoCacheException: Value not cached, or expired.
+        """
+        with self._lock:
+            try:
+                value, timestamp = self._entries[key]
+            except KeyError:
+                raise NoCacheException()
+
+            if self.expiry and monotonic() - timestamp > self.expiry:
+                del self._entries[key]
+                raise NoCacheException()
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """
+        Cache a value.
+
+        Args:
+            key (hashable object): Cache key.
+            value (object): Value to cache.
+        """
+        with self._lock:
+            entries = self._entries
+            entries[key] = (value, monotonic())
+            entries.move_to_end(key)
+            if self.max_size:
+                while len(entries) > self.max_size:
+                    entries.popitem(last=False)
+
+    def pop(self, key):
+        """
+        Discard a cached value if any.
+
+        Args:
+            key (hashable object): Cache key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """
+        Discard all cached values.
+        """
+        with self._lock:
+            self._entries.clear()
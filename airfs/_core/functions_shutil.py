@@ -34,27 +34,30 @@ def _copy(src, dst, src_is_storage, dst_is_storage, follow_symlinks):
             system_src = get_instance(src)
             system_dst = get_instance(dst)
 
-            if system_src is system_dst:
+            try:
+                if system_src is system_dst:
 
-                if system_src.relpath(src) == system_dst.relpath(dst):
-                    raise ObjectSameFileError(path1=src, path2=dst)
+                    if system_src.relpath(src) == system_dst.relpath(dst):
+                        raise ObjectSameFileError(path1=src, path2=dst)
 
-                try:
-                    return system_dst.copy(src, dst)
-                except AirfsInternalException:
-                    pass
-
-            for caller, called, method in (
-                (system_dst, system_src, "copy_from_%s"),
-                (system_src, system_dst, "copy_to_%s"),
-            ):
-                if hasattr(caller, method % called.storage):
                     try:
-                        return getattr(caller, method % called.storage)(
-                            src, dst, called, follow_symlinks
-                        )
+                        return system_dst.copy(src, dst)
                     except AirfsInternalException:
-                        continue
+                        pass
+
+                for caller, called, method in (
+                    (system_dst, system_src, "copy_from_%s"),
+                    (system_src, system_dst, "copy_to_%s"),
+                ):
+                    if hasattr(caller, method % called.storage):
+                        try:
+                            return getattr(caller, method % called.storage)(
+                                src, dst, called, follow_symlinks
+                            )
+                        except AirfsInternalException:
+                            continue
+            finally:
+                system_dst.invalidate_header(dst)
 
         _copy_stream(dst, src)
 
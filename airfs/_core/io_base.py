@@ -1,11 +1,12 @@
 """Cloud storage abstract IO Base class"""
-from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
-from io import IOBase, UnsupportedOperation
+from io import IOBase, RawIOBase, UnsupportedOperation
 from itertools import chain
-from os import fsdecode
+from os import fsdecode, SEEK_CUR, SEEK_END, SEEK_SET
 from threading import Lock
 
+from airfs._core.workers import WorkerQueue
+
 
 class ObjectIOBase(IOBase):
     """
@@ -157,12 +158,16 @@ class WorkerPoolBase:
     """
     Base class that handle a worker pool.
 
+    Tasks are run on the process wide shared worker pool (See "airfs._core.workers").
+
     Args:
-        max_workers (int): Maximum number of workers.
+        max_workers (int): Maximum number of tasks running concurrently.
+        storage (str): Storage name, used to apply the storage concurrency limit.
     """
 
-    def __init__(self, max_workers=None):
+    def __init__(self, max_workers=None, storage=None):
         self._workers_count = max_workers
+        self._workers_storage = storage
 
     @property  # type: ignore
     @memoizedmethod
@@ -170,8 +175,8 @@ class WorkerPoolBase:
         """Executor pool
 
         Returns:
-            concurrent.futures.Executor: Executor pool"""
-        return ThreadPoolExecutor(max_workers=self._workers_count)
+            airfs._core.workers.WorkerQueue: Executor pool"""
+        return WorkerQueue(self._workers_storage, self._workers_count)
 
     def _generate_async(self, generator):
         """
@@ -202,3 +207,103 @@ class WorkerPoolBase:
                 return
 
         return chain(get_first_element(), generator)
+
+
+class MemoryViewReader(RawIOBase):
+    """
+    Read only file-like object over a buffer, without copy of the buffer.
+
+    Used to pass buffers to SDK that only accept "bytes" or file-like objects.
+
+    Args:
+        buffer (bytes-like object): Buffer.
+    """
+
+    def __init__(self, buffer):
+        RawIOBase.__init__(self)
+        self._view = memoryview(buffer).cast("B")
+        self._seek = 0
+
+    def __len__(self):
+        return len(self._view)
+
+    def readable(self):
+        """
+        Return True if the stream can be read from.
+
+        Returns:
+            bool: Supports reading.
+        """
+        return True
+
+    def seekable(self):
+        """
+        Return True if the stream supports random access.
+
+        Returns:
+            bool: Supports random access.
+        """
+        return True
+
+    def read(self, size=-1):
+        """
+        Read and return up to size bytes.
+
+        Args:
+            size (int): Number of bytes to read. -1 to read the stream until end.
+
+        Returns:
+            bytes: Content
+        """
+        start = self._seek
+        end = len(self._view) if size is None or size < 0 else start + size
+        data = self._view[start:end].tobytes()
+        self._seek = start + len(data)
+        return data
+
+    def readinto(self, b):
+        """
+        Read bytes into a pre-allocated, writable bytes-like object b, and return the
+        number of bytes read.
+
+        Args:
+            b (bytes-like object): buffer.
+
+        Returns:
+            int: number of bytes read
+        """
+        b_view = memoryview(b).cast("B")
+        start = self._seek
+        data = self._view[start : start + len(b_view)]
+        size = len(data)
+        b_view[:size] = data
+        self._seek = start + size
+        return size
+
+    def seek(self, offset, whence=SEEK_SET):
+        """
+        Change the stream position to the given byte offset.
+
+        Args:
+            offset (int): Offset is interpreted relative to the position indicated by
+                whence.
+            whence (int): SEEK_SET, SEEK_CUR or SEEK_END.
+
+        Returns:
+            int: The new absolute position.
+        """
+        if whence == SEEK_CUR:
+            offset += self._seek
+        elif whence == SEEK_END:
+            offset += len(self._view)
+        self._seek = max(offset, 0)
+        return self._seek
+
+    def tell(self):
+        """
+        Return the current stream position.
+
+        Returns:
+            int: Stream position.
+        """
+        return self._seek
@@ -1,12 +1,13 @@
 """Cloud storage abstract buffered IO class"""
 from abc import abstractmethod
-from concurrent.futures import as_completed
+from concurrent.futures import as_completed, wait
+from functools import partial
 from io import BufferedIOBase, UnsupportedOperation
 from math import ceil
 from os import SEEK_SET
-from threading import Lock
-from time import sleep
+from threading import BoundedSemaphore, Lock
 
+from airfs._core import memory
 from airfs._core.io_base import ObjectIOBase, WorkerPoolBase
 from airfs._core.io_base_raw import ObjectRawIOBase
 from airfs._core.exceptions import handle_os_exceptions
@@ -21,9 +22,11 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
         mode (str): The mode can be 'r' (default), 'w' for reading (default) or writing.
         buffer_size (int): The size of buffer.
         max_buffers (int): The maximum number of buffers to preload in read mode or
-            awaiting flush in write mode. 0 for no limit.
-        max_workers (int): The maximum number of threads that can be used to execute the
-            given calls.
+            awaiting flush in write mode. 0 for no limit. In read mode, the number of
+            preloaded buffers grows up to this value on sequential reads, and
+            read-ahead is disabled on random reads.
+        max_workers (int): The maximum number of background tasks of this stream that
+            can run concurrently on the shared worker pool.
         storage_parameters (dict): Storage configuration parameters.
             Generally, client configuration and credentials.
         unsecure (bool): If True, disables TLS/SSL to improves transfer performance.
@@ -41,7 +44,13 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
         "_size",
         "_size_lock",
         "_read_range",
+        "_read_range_into",
         "_read_queue",
+        "_read_ahead",
+        "_read_last",
+        "_read_end",
+        "_flush_futures",
+        "_flush_slots",
     )
 
     #: Raw I/O class
@@ -56,8 +65,8 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
     #: Maximum buffer_size value in bytes (0 for no limit)
     MAXIMUM_BUFFER_SIZE = 0
 
-    #: Time to wait before try a new flush if number of buffer currently in
-    #: flush > max_buffer
+    #: Time to wait before retrying a flush that requires previous flushes to be
+    #: completed
     _FLUSH_WAIT = 0.01
 
     def __init__(
@@ -75,9 +84,9 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
 
         BufferedIOBase.__init__(self)
         ObjectIOBase.__init__(self, name, mode=mode)
-        WorkerPoolBase.__init__(self, max_workers)
 
         self._raw = self._RAW_CLASS(name, mode=mode, **kwargs)
+        WorkerPoolBase.__init__(self, max_workers, self._raw._system.storage)
         self._raw._is_raw_of_buffered = True
         self._mode = self._raw.mode
         self._name = self._raw.name
@@ -95,9 +104,11 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
         if self._writable:
             self._max_buffers = max_buffers
             self._buffer_seek = 0
-            self._write_buffer = bytearray(self._buffer_size)
+            self._write_buffer = memory.get_buffer(self._buffer_size)
             self._seekable = False
             self._write_futures = []
+            self._flush_futures = set()
+            self._flush_slots = BoundedSemaphore(max_buffers) if max_buffers else None
             self._raw_flush = self._raw._flush
 
             # Size used only with random write access
@@ -109,12 +120,16 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
         else:
             self._size = self._raw._size
             self._read_range = self.raw._read_range
+            self._read_range_into = self.raw._read_range_into
             self._seekable = self.raw._seekable
             if max_buffers:
                 self._max_buffers = max_buffers
             else:
                 self._max_buffers = ceil(self._size / self._buffer_size)
             self._read_queue = dict()
+            self._read_ahead = 0
+            self._read_last = 0
+            self._read_end = 0
 
     @property
     def _client(self):
@@ -129,14 +144,25 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
     def close(self):
         """
         Flush the write buffers of the stream if applicable and close the object.
+
+        In read mode, cancel preloading of buffers not read yet.
         """
         if self._writable and not self._closed:
             self._closed = True
             with self._seek_lock:
                 self._flush_raw_or_buffered()
-            if self._seek:
-                with handle_os_exceptions():
-                    self._close_writable()
+            try:
+                if self._seek:
+                    with handle_os_exceptions():
+                        self._close_writable()
+            finally:
+                self._raw._system.invalidate_header(client_kwargs=self._client_kwargs)
+
+        elif self._readable:
+            # Cancel reads not started yet
+            with self._seek_lock:
+                for index in tuple(self._read_queue):
+                    self._drop_buffer(index)
 
     def _close_writable(self):
         """
@@ -155,7 +181,7 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
         if self._writable:
             with self._seek_lock:
                 self._flush_raw_or_buffered()
-                self._write_buffer = bytearray(self._buffer_size)
+                self._write_buffer = memory.get_buffer(self._buffer_size)
                 self._buffer_seek = 0
 
     def _flush_raw_or_buffered(self):
@@ -167,12 +193,13 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
         # This step is performed by raw stream.
         if self._buffer_seek and self._seek:
             self._seek += 1
+            self._get_buffer_object()
             with handle_os_exceptions():
                 self._flush()
 
         # If data lower than buffer size flush data with raw stream to reduce IO calls
         elif self._buffer_seek:
-            self._raw._write_buffer = self._get_buffer()
+            self._raw._write_buffer = self._get_buffer_object()
             self._raw._seek = self._buffer_seek
             self._raw.flush()
 
@@ -184,6 +211,52 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
         In write mode, send the buffer content to the storage object.
         """
 
+    def _submit_flush(self, function, *args, **kwargs):
+        """
+        Submit a flush task to the workers.
+
+        The flushed buffer is accounted in the memory budget until the task is done.
+        If the budget is used up, or if "max_buffers" flushes are already in
+        progress, wait for previous buffers of this stream to be flushed.
+
+        Args:
+            function (callable): Function to call.
+            args: Function positional arguments.
+            kwargs: Function keyword arguments.
+
+        Returns:
+            concurrent.futures.Future: Future representing the call execution.
+        """
+        if self._flush_slots is not None:
+            self._flush_slots.acquire()
+
+        size = self._buffer_size
+        flush_futures = self._flush_futures
+        memory.acquire(size, pending=flush_futures.__len__)
+
+        future = self._workers.submit(function, *args, **kwargs)
+        flush_futures.add(future)
+        future.add_done_callback(partial(self._flush_done, size, self._write_buffer))
+        return future
+
+    def _flush_done(self, size, buffer, future):
+        """
+        Release the memory and the slot of a flushed buffer, and recycle the buffer.
+
+        Used as callback of flush tasks futures.
+
+        Args:
+            size (int): Buffer size.
+            buffer (bytearray): Flushed write buffer.
+            future (concurrent.futures.Future): future.
+        """
+        self._flush_futures.discard(future)
+        if len(buffer) == size:
+            memory.recycle_buffer(buffer)
+        memory.release(size)
+        if self._flush_slots is not None:
+            self._flush_slots.release()
+
     def _get_buffer(self):
         """
         Get a memory view of the current write buffer until its seek value.
@@ -193,6 +266,25 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
         """
         return memoryview(self._write_buffer)[: self._buffer_seek]
 
+    def _get_buffer_object(self):
+        """
+        Get the current write buffer until its seek value, without copy.
+
+        The buffer is truncated if not full. This is used to pass the buffer to SDK
+        that do not accept memory views.
+
+        Returns:
+            bytearray: buffer.
+        """
+        buffer = self._write_buffer
+        if len(buffer) != self._buffer_seek:
+            try:
+                del buffer[self._buffer_seek :]
+            except BufferError:
+                # Buffer currently exported by a memory view
+                return buffer[: self._buffer_seek]
+        return buffer
+
     def peek(self, size=-1):
         """
         Return bytes from the stream without advancing the position.
@@ -205,28 +297,115 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
         """
         if not self._readable:
             raise UnsupportedOperation("read")
+        elif self._seekable:
+            with self._seek_lock:
+                if self._seek >= self._size:
+                    return b""
+
+                buffer, start = self._peek_read_buffer()
+                end = len(buffer) if size is None or size < 0 else start + size
+                if end <= len(buffer):
+                    # Served from the preloaded buffer at current position
+                    return bytes(memoryview(buffer)[start:end])
 
         with self._seek_lock:
             self._raw.seek(self._seek)
             return self._raw._peek(size)
 
-    def _preload_range(self):
-        """Preload data for reading"""
+    def _peek_read_buffer(self):
+        """
+        Get the buffer at the current position, preloading it if required.
+
+        Must be called with the seek lock acquired.
+
+        Returns:
+            tuple: buffer content bytes, current position in the buffer int.
+        """
+        seek = self._seek
+        self._update_read_ahead()
+        self._preload_range(seek)
+        index = seek - seek % self._buffer_size
+        with handle_os_exceptions():
+            return self._get_read_buffer(index), seek - index
+
+    def _update_read_ahead(self):
+        """
+        Update the read-ahead window from the access pattern.
+
+        A read starting where the previous one ended, or in an already preloaded
+        buffer, is sequential and doubles the window up to "max_buffers". Any other
+        read is random: preloaded buffers are dropped and read-ahead is disabled
+        until the next sequential read.
+        """
+        seek = self._seek
+        if seek != self._read_last:
+            queue = self._read_queue
+            start = seek - seek % self._buffer_size
+            sequential = start in queue
+
+            for index in tuple(queue):
+                if index < start or not sequential:
+                    self._drop_buffer(index)
+
+            if not sequential:
+                self._read_ahead = 0
+                self._read_end = 0
+                return
+
+        self._read_ahead = min(max(self._read_ahead * 2, 1), self._max_buffers)
+
+    def _drop_buffer(self, index):
+        """
+        Remove a buffer from the read queue, cancel its read if not started yet and
+        release its memory.
+
+        Args:
+            index (int): Buffer position in the stream.
+        """
+        buffer = self._read_queue.pop(index)
+        memory.release(self._buffer_size)
+        try:
+            buffer.cancel()
+        except AttributeError:
+            # Already evaluated
+            pass
+
+    def _preload_range(self, seek):
+        """
+        Preload buffers of the read-ahead window.
+
+        The buffer at the current position is always loaded, next buffers are
+        preloaded only while the memory budget allows it.
+
+        Args:
+            seek (int): Current stream position.
+        """
         queue = self._read_queue
         size = self._buffer_size
-        start = self._seek
-        end = int(start + size * self._max_buffers)
+        start = seek - seek % size
+        end = min(start + size * (self._read_ahead + 1), self._size)
         workers_submit = self._workers.submit
-        indexes = tuple(range(start, end, size))
+        read_range = self._read_range
 
-        for seek in tuple(queue):
-            if seek not in indexes:
-                del queue[seek]
+        first = max(start, self._read_end)
+        if seek < self._size and start not in queue:
+            # Current buffer dropped before being fully read (EOF before theoretical
+            # EOF)
+            first = start
+
+        for index in range(first, end, size):
+            if index not in queue:
+                if index == start:
+                    # Required by the current read
+                    memory.reserve(size)
+                elif not memory.acquire(size, blocking=False):
+                    # Memory budget used up: Retry on next read
+                    end = index
+                    break
+                queue[index] = workers_submit(read_range, index, index + size)
 
-        read_range = self._read_range
-        for seek in indexes:
-            if seek not in queue:
-                queue[seek] = workers_submit(read_range, seek, seek + size)
+        if end > self._read_end:
+            self._read_end = end
 
     @property
     def raw(self):
@@ -256,35 +435,32 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
         elif not self._seekable:
             return self._raw.read(size)
 
-        if self._seek == self._size:
-            return b""
-
-        if size == self._buffer_size:
-            queue_index = self._seek
-
-            if queue_index == 0:
-                self._preload_range()
+        with self._seek_lock:
+            seek = self._seek
+            if seek >= self._size:
+                return b""
 
-            with handle_os_exceptions():
-                buffer = self._read_queue.pop(queue_index).result()
+            if size is None or size < 0:
+                size = self._size - seek
 
-            buffer_size = self._buffer_size
-            index = queue_index + buffer_size * self._max_buffers
-            if index < self._size:
-                self._read_queue[index] = self._workers.submit(
-                    self._read_range, index, index + buffer_size
-                )
+            elif size == self._buffer_size and not seek % size:
+                # Aligned buffer size read: Returns the preloaded buffer without copy
+                self._update_read_ahead()
+                if self._read_ahead:
+                    self._preload_range(seek)
+                    with handle_os_exceptions():
+                        buffer = self._get_read_buffer(seek)
+                    self._drop_buffer(seek)
 
-            self._seek += len(buffer)
-            return buffer
+                    self._seek = seek = seek + len(buffer)
+                    self._read_last = seek
+                    self._raw.seek(seek)
+                    self._preload_range(seek)
+                    return buffer
 
-        if size != -1:
             buffer = bytearray(size)
+            read_size = self._readinto(memoryview(buffer), size)
 
-        else:
-            buffer = bytearray()
-
-        read_size = self.readinto(buffer)
         return memoryview(buffer)[:read_size].tobytes()
 
     def read1(self, size=-1):
@@ -300,7 +476,69 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
         Returns:
             bytes: Object content
         """
-        return self._raw.read(size)
+        if not self._readable:
+            raise UnsupportedOperation("read")
+        elif not self._seekable:
+            return self._raw.read(size)
+
+        with self._seek_lock:
+            seek = self._seek
+            if seek >= self._size:
+                return b""
+
+            # Read at most until the end of the buffer at current position
+            available = self._buffer_size - seek % self._buffer_size
+            if size is None or size < 0 or size > available:
+                size = available
+
+            buffer = bytearray(size)
+            read_size = self._readinto(memoryview(buffer), size)
+
+        return memoryview(buffer)[:read_size].tobytes()
+
+    def readline(self, size=-1):
+        """
+        Read and return one line from the stream.
+
+        Args:
+            size (int): If specified, at most size bytes will be read.
+
+        Returns:
+            bytes: Line content
+        """
+        if not self._readable:
+            raise UnsupportedOperation("read")
+        elif not self._seekable:
+            return self._raw.readline(size)
+
+        if size is None:
+            size = -1
+
+        line = []
+        read_size = 0
+        with self._seek_lock:
+            while (size < 0 or read_size < size) and self._seek < self._size:
+                buffer, start = self._peek_read_buffer()
+                end = len(buffer)
+                if size >= 0:
+                    end = min(end, start + size - read_size)
+                if end <= start:
+                    # EOF
+                    break
+
+                newline = buffer.find(b"\n", start, end)
+                if newline != -1:
+                    end = newline + 1
+
+                chunk = bytearray(end - start)
+                chunk_size = self._readinto(memoryview(chunk), end - start)
+                line.append(chunk)
+                read_size += chunk_size
+
+                if newline != -1 or chunk_size < end - start:
+                    break
+
+        return b"".join(line)
 
     def readinto(self, b):
         """
@@ -318,77 +556,148 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
         elif not self._seekable:
             return self._raw.readinto(b)
 
+        b_view = memoryview(b).cast("B")
         with self._seek_lock:
-            seek = self._seek
-            queue = self._read_queue
+            return self._readinto(b_view, len(b_view))
 
-            if seek == 0:
-                self._preload_range()
+    def _readinto(self, b_view, size):
+        """
+        Read bytes into a buffer, and return the number of bytes read.
 
-            size = len(b)
-            if size:
-                # Preallocated buffer: Use memory view to avoid copies
-                b_view = memoryview(b)
-                size_left = size
-            else:
-                # Dynamic buffer: Can't avoid copy, read until EOF
-                b_view = b
-                size_left = -1
-            b_end = 0
+        Must be called with the seek lock acquired.
 
-            buffer_size = self._buffer_size
-            while size_left > 0 or size_left == -1:
-                start = seek % buffer_size
-                queue_index = seek - start
-                try:
-                    buffer = queue[queue_index]
-                except KeyError:
-                    # EOF
-                    break
+        Args:
+            b_view (memoryview): buffer.
+            size (int): Number of bytes to read.
 
-                with handle_os_exceptions():
-                    try:
-                        queue[queue_index] = buffer = buffer.result()
+        Returns:
+            int: number of bytes read
+        """
+        seek = self._seek
+        file_size = self._size
+        if not size or seek >= file_size:
+            return 0
+
+        self._update_read_ahead()
+
+        if not self._read_ahead:
+            # Random access: Read only the requested range, without read-ahead
+            with handle_os_exceptions():
+                read_size = self._read_range_into(
+                    seek, b_view[: min(size, file_size - seek)]
+                )
 
-                    except AttributeError:
-                        # Already evaluated
-                        pass
-                buffer_view = memoryview(buffer)
+        else:
+            buffer_size = self._buffer_size
+            read_size = 0
+
+            while read_size < size and seek + read_size < file_size:
+                position = seek + read_size
+                start = position % buffer_size
+                index = position - start
+
+                if (
+                    not start
+                    and size - read_size >= buffer_size
+                    and index not in self._read_queue
+                ):
+                    # Buffers not preloaded yet: Read them directly in the caller buffer
+                    direct_size = min(
+                        size - read_size - (size - read_size) % buffer_size,
+                        file_size - position,
+                    )
+                    chunk_size = self._read_direct(
+                        b_view[read_size : read_size + direct_size], position
+                    )
+                    read_size += chunk_size
+                    if chunk_size < direct_size:
+                        # EOF
+                        break
+                    continue
+
+                self._preload_range(position)
+                with handle_os_exceptions():
+                    buffer = self._get_read_buffer(index)
                 data_size = len(buffer)
 
-                if not data_size:
+                end = min(start + size - read_size, data_size)
+                if end <= start:
+                    # EOF
                     break
 
-                if size_left != -1:
-                    end = start + size_left
-                else:
-                    end = data_size - start
+                b_view[read_size : read_size + end - start] = memoryview(buffer)[
+                    start:end
+                ]
+                read_size += end - start
 
-                if end >= data_size:
-                    end = data_size
+                if end == data_size:
+                    self._drop_buffer(index)
+                    if data_size < buffer_size:
+                        # EOF
+                        break
 
-                    del queue[queue_index]
+            self._preload_range(seek + read_size)
 
-                    index = queue_index + buffer_size * self._max_buffers
-                    if index < self._size:
-                        queue[index] = self._workers.submit(
-                            self._read_range, index, index + buffer_size
-                        )
+        self._seek = seek = seek + read_size
+        self._read_last = seek
+        self._raw.seek(seek)
+        return read_size
 
-                read_size = end - start
-                if size_left != -1:
-                    size_left -= read_size
-                seek += read_size
+    def _read_direct(self, b_view, seek):
+        """
+        Read buffers in parallel directly into a pre-allocated buffer.
 
-                b_start = b_end
-                b_end = b_start + read_size
+        Args:
+            b_view (memoryview): Buffer of bytes format.
+            seek (int): Stream position.
 
-                b_view[b_start:b_end] = buffer_view[start:end]
+        Returns:
+            int: number of bytes read
+        """
+        buffer_size = self._buffer_size
+        read_range_into = self._read_range_into
+        workers_submit = self._workers.submit
+        futures = [
+            workers_submit(
+                read_range_into, seek + start, b_view[start : start + buffer_size]
+            )
+            for start in range(0, len(b_view), buffer_size)
+        ]
+
+        read_size = 0
+        try:
+            with handle_os_exceptions():
+                for future in futures:
+                    chunk_size = future.result()
+                    read_size += chunk_size
+                    if chunk_size < buffer_size:
+                        # EOF
+                        break
+        finally:
+            # The caller buffer must not be modified after returning
+            for future in futures:
+                future.cancel()
+            wait(futures)
+
+        return read_size
+
+    def _get_read_buffer(self, index):
+        """
+        Get a preloaded buffer content, waiting for its read if required.
 
-            self._seek = seek
-            self._raw.seek(seek)
+        Args:
+            index (int): Buffer position in the stream.
 
-        return b_end
+        Returns:
+            bytes: Buffer content.
+        """
+        buffer = self._read_queue[index]
+        try:
+            self._read_queue[index] = buffer = buffer.result()
+        except AttributeError:
+            # Already evaluated
+            pass
+        return buffer
 
     def readinto1(self, b):
         """
@@ -403,7 +712,16 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
         Returns:
             int: number of bytes read
         """
-        return self._raw.readinto(b)
+        if not self._readable:
+            raise UnsupportedOperation("read")
+        elif not self._seekable:
+            return self._raw.readinto(b)
+
+        b_view = memoryview(b).cast("B")
+        with self._seek_lock:
+            # Read at most until the end of the buffer at current position
+            available = self._buffer_size - self._seek % self._buffer_size
+            return self._readinto(b_view, min(len(b_view), available))
 
     def seek(self, offset, whence=SEEK_SET):
         """
@@ -428,8 +746,6 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
             self.raw.seek(offset, whence)
             self._seek = seek = self.raw._seek
 
-            self._preload_range()
-
         return seek
 
     def write(self, b):
@@ -450,7 +766,6 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
         b_view = memoryview(b)
         size_left = size
         buffer_size = self._buffer_size
-        max_buffers = self._max_buffers
 
         with self._seek_lock:
             end = self._buffer_seek
@@ -477,19 +792,10 @@ class ObjectBufferedIOBase(BufferedIOBase, ObjectIOBase, WorkerPoolBase):
                     self._buffer_seek = end
                     self._seek += 1
 
-                    if max_buffers:
-                        futures = self._write_futures
-                        flush_wait = self._FLUSH_WAIT
-                        while (
-                            sum(1 for future in futures if not future.done())
-                            >= max_buffers
-                        ):
-                            sleep(flush_wait)
-
                     with handle_os_exceptions():
                         self._flush()
 
-                    self._write_buffer = bytearray(buffer_size)
+                    self._write_buffer = memory.get_buffer(buffer_size)
                     buffer_view = memoryview(self._write_buffer)
                     end = 0
 
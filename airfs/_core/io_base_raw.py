@@ -1,5 +1,7 @@
 """Cloud storage abstract Raw IO class"""
 from abc import abstractmethod
+from concurrent.futures import wait
+from functools import partial
 from io import RawIOBase, UnsupportedOperation
 from os import SEEK_CUR, SEEK_END, SEEK_SET
 
@@ -10,6 +12,7 @@ from airfs._core.exceptions import (
 )
 from airfs._core.io_base import ObjectIOBase, memoizedmethod
 from airfs._core.io_base_system import SystemBase
+from airfs._core.workers import WorkerQueue
 
 
 class ObjectRawIOBase(RawIOBase, ObjectIOBase):
@@ -46,6 +49,19 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
     #: Maximum size of one flush operation (0 for no limit)
     MAX_FLUSH_SIZE = 0
 
+    #: Minimum size in bytes to read with parallel ranged requests in "readall"
+    #: (0 to always use a single request)
+    READALL_PARALLEL_THRESHOLD = 33554432
+
+    #: Size in bytes of ranges read in parallel in "readall"
+    READALL_CHUNK_SIZE = 8388608
+
+    #: Maximum number of ranges read concurrently in "readall"
+    READALL_MAX_WORKERS = 8
+
+    #: Size of chunks used to read responses bodies that do not support "readinto"
+    _STREAM_CHUNK_SIZE = 65536
+
     def __init__(self, name, mode="r", storage_parameters=None, **kwargs):
 
         RawIOBase.__init__(self)
@@ -102,6 +118,8 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
                 with handle_os_exceptions():
                     self._create()
 
+            self._system.invalidate_header(client_kwargs=self._client_kwargs)
+
         else:
             with handle_os_exceptions():
                 self._head()
@@ -138,8 +156,11 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
         storage.
         """
         if self._writable:
-            with handle_os_exceptions():
-                self._flush(self._get_buffer())
+            try:
+                with handle_os_exceptions():
+                    self._flush(self._get_buffer())
+            finally:
+                self._system.invalidate_header(client_kwargs=self._client_kwargs)
 
     @abstractmethod
     def _flush(self, buffer):
@@ -256,10 +277,12 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
 
         with self._seek_lock:
             with handle_os_exceptions():
-                if self._seek and self._seekable:
+                data = self._readall_parallel(self._seek)
+
+                if data is None and self._seek and self._seekable:
                     data = self._read_range(self._seek)
 
-                else:
+                elif data is None:
                     data = self._readall()
 
             self._seek += len(data)
@@ -274,6 +297,60 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
         """
         return self._read_range(0)
 
+    def _readall_parallel(self, start):
+        """
+        Read and return all the bytes from a position until EOF, using parallel ranged
+        requests into a single pre-allocated buffer.
+
+        Args:
+            start (int): Start stream position.
+
+        Returns:
+            bytes: Object content, or None if the size to read is unknown or lower
+                than "READALL_PARALLEL_THRESHOLD".
+        """
+        threshold = self.READALL_PARALLEL_THRESHOLD
+        if not threshold or not self._seekable:
+            return None
+
+        try:
+            size = self._size - start
+        except UnsupportedOperation:
+            # Unknown size
+            return None
+
+        if size < threshold:
+            return None
+
+        buffer = bytearray(size)
+        b_view = memoryview(buffer)
+        chunk_size = self.READALL_CHUNK_SIZE
+        read_range_into = self._read_range_into
+        workers_submit = WorkerQueue(
+            self._system.storage, self.READALL_MAX_WORKERS
+        ).submit
+        futures = [
+            workers_submit(
+                read_range_into, start + index, b_view[index : index + chunk_size]
+            )
+            for index in range(0, size, chunk_size)
+        ]
+
+        read_size = 0
+        try:
+            for future in futures:
+                range_size = future.result()
+                read_size += range_size
+                if range_size < chunk_size:
+                    # EOF
+                    break
+        finally:
+            for future in futures:
+                future.cancel()
+            wait(futures)
+
+        return b_view[:read_size].tobytes()
+
     def readinto(self, b):
         """
         Read bytes into a pre-allocated, writable bytes-like object b, and return the
@@ -288,18 +365,18 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
         if not self._readable:
             raise UnsupportedOperation("read")
 
-        size = len(b)
+        b_view = memoryview(b).cast("B")
+        size = len(b_view)
+        if not size:
+            return 0
+
         with self._seek_lock:
             start = self._seek
             end = start + size
             self._seek = end
 
         with handle_os_exceptions():
-            read_data = self._read_range(start, end)
-
-        read_size = len(read_data)
-        if read_size:
-            memoryview(b)[:read_size] = read_data
+            read_size = self._read_range_into(start, b_view)
 
         if read_size != size:
             with self._seek_lock:
@@ -320,6 +397,69 @@ class ObjectRawIOBase(RawIOBase, ObjectIOBase):
             bytes: number of bytes read
         """
 
+    def _read_range_into(self, start, b_view):
+        """
+        Read a range of bytes in stream into a pre-allocated buffer.
+
+        The default implementation copies the result of "_read_range". Storage that
+        can stream the response body should override this method to write it directly
+        into the buffer, without allocating the full range in memory.
+
+        Args:
+            start (int): Start stream position.
+            b_view (memoryview): Buffer of bytes format. The buffer size defines the
+                end stream position.
+
+        Returns:
+            int: number of bytes read
+        """
+        data = self._read_range(start, start + len(b_view))
+        read_size = len(data)
+        b_view[:read_size] = data
+        return read_size
+
+    @classmethod
+    def _readinto_from_stream(cls, stream, b_view):
+        """
+        Read a response body into a pre-allocated buffer.
+
+        Args:
+            stream (file-like object or iterable of bytes): Response body. The
+                "readinto" method is used if available, else the "read" method. If
+                none is available, the object must be an iterable of bytes chunks.
+            b_view (memoryview): Buffer of bytes format.
+
+        Returns:
+            int: number of bytes read
+        """
+        size = len(b_view)
+        read_size = 0
+
+        try:
+            readinto = stream.readinto
+        except AttributeError:
+            pass
+        else:
+            while read_size < size:
+                chunk_size = readinto(b_view[read_size:])
+                if not chunk_size:
+                    break
+                read_size += chunk_size
+            return read_size
+
+        try:
+            chunks = iter(partial(stream.read, cls._STREAM_CHUNK_SIZE), b"")
+        except AttributeError:
+            chunks = stream
+
+        for chunk in chunks:
+            chunk_size = min(len(chunk), size - read_size)
+            b_view[read_size : read_size + chunk_size] = memoryview(chunk)[:chunk_size]
+            read_size += chunk_size
+            if read_size == size:
+                break
+        return read_size
+
     def seek(self, offset, whence=SEEK_SET):
         """
         Change the stream position to the given byte offset.
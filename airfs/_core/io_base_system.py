@@ -1,12 +1,15 @@
 """Cloud storage abstract System"""
 from abc import abstractmethod, ABC
 from collections import OrderedDict, namedtuple
+from concurrent.futures import Future
 from re import compile
 from stat import S_IFDIR, S_IFREG, S_IFLNK
 from posixpath import join, normpath, dirname
 from dateutil.parser import parse
 
+from airfs._core.cache import MemoryCache, NoCacheException
 from airfs._core.io_base import WorkerPoolBase
+from airfs._core.workers import WorkerQueue
 from airfs._core.compat import Pattern, getgid, getuid
 from airfs._core.exceptions import (
     ObjectNotFoundError,
@@ -32,6 +35,9 @@ class SystemBase(ABC, WorkerPoolBase):
         unsecure (bool): If True, disables TLS/SSL to improves transfer performance.
             But makes connection unsecure.
         roots (tuple): Tuple of roots to force use.
+
+    The objects headers cache can be configured with the "airfs.header_cache_expiry"
+    and "airfs.header_cache_max_size" storage parameters.
     """
 
     __slots__ = (
@@ -40,12 +46,22 @@ class SystemBase(ABC, WorkerPoolBase):
         "_storage",
         "_client",
         "_cache",
+        "_header_cache",
         "_roots",
     )
 
     #: If True, storage support symlinks
     SUPPORTS_SYMLINKS = False
 
+    #: Delay in seconds objects headers are cached. 0 to disable the cache.
+    HEADER_CACHE_EXPIRY = 0
+
+    #: Maximum number of objects headers cached.
+    HEADER_CACHE_MAX_SIZE = 1024
+
+    #: Maximum number of directories listed concurrently when listing a full tree.
+    LIST_MAX_WORKERS = 8
+
     # By default, assumes that information are in a standard HTTP header
     _SIZE_KEYS = ("Content-Length",)
     _CTIME_KEYS = ()
@@ -54,9 +70,15 @@ class SystemBase(ABC, WorkerPoolBase):
     _CHAR_FILTER = compile(r"[^a-z0-9_]*")
 
     def __init__(self, storage_parameters=None, unsecure=False, roots=None, **_):
-        WorkerPoolBase.__init__(self)
-
+        header_cache_expiry = self.HEADER_CACHE_EXPIRY
+        header_cache_max_size = self.HEADER_CACHE_MAX_SIZE
         if storage_parameters:
+            header_cache_expiry = storage_parameters.get(
+                "airfs.header_cache_expiry", header_cache_expiry
+            )
+            header_cache_max_size = storage_parameters.get(
+                "airfs.header_cache_max_size", header_cache_max_size
+            )
             storage_parameters = storage_parameters.copy()
             for key in tuple(storage_parameters):
                 if key.startswith("airfs."):
@@ -67,11 +89,17 @@ class SystemBase(ABC, WorkerPoolBase):
         self._storage_parameters = storage_parameters
         self._unsecure = unsecure
         self._storage = self.__module__.rsplit(".", 1)[1]
+        WorkerPoolBase.__init__(self, storage=self._storage)
 
         self._client = None
 
         self._cache = {}
 
+        if header_cache_expiry:
+            self._header_cache = MemoryCache(header_cache_max_size, header_cache_expiry)
+        else:
+            self._header_cache = None
+
         if roots:
             self._roots = roots
         else:
@@ -420,7 +448,60 @@ class SystemBase(ABC, WorkerPoolBase):
             return header
         elif client_kwargs is None:
             client_kwargs = self.get_client_kwargs(path)
-        return self._head(client_kwargs)
+
+        if self._header_cache is None:
+            return self._head(client_kwargs)
+
+        key = self._header_cache_key(client_kwargs)
+        if key is None:
+            return self._head(client_kwargs)
+
+        try:
+            return self._header_cache.get(key).copy()
+        except NoCacheException:
+            header = self._head(client_kwargs)
+            self._header_cache.set(key, header.copy())
+            return header
+
+    @staticmethod
+    def _header_cache_key(client_kwargs):
+        """
+        Get the headers cache key of an object.
+
+        Args:
+            client_kwargs (dict): Client arguments.
+
+        Returns:
+            tuple: Cache key, or None if the object can't be cached.
+        """
+        key = tuple(sorted(client_kwargs.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def invalidate_header(self, path=None, client_kwargs=None):
+        """
+        Discard the cached header of an object.
+
+        Should be called when the object is modified.
+
+        Args:
+            path (str): Path or URL. If both "path" and "client_kwargs" are not
+                specified, discard all cached headers.
+            client_kwargs (dict): Client arguments.
+        """
+        if self._header_cache is None:
+            return
+        elif client_kwargs is None and path is None:
+            return self._header_cache.clear()
+        elif client_kwargs is None:
+            client_kwargs = self.get_client_kwargs(path)
+
+        key = self._header_cache_key(client_kwargs)
+        if key is not None:
+            self._header_cache.pop(key)
 
     @property
     def roots(self):
@@ -530,9 +611,13 @@ class SystemBase(ABC, WorkerPoolBase):
         """
         if not relative:
             path = self.relpath(path)
-        self._make_dir(
-            self.get_client_kwargs(self.ensure_dir_path(path, relative=True))
+        client_kwargs = self.get_client_kwargs(
+            self.ensure_dir_path(path, relative=True)
         )
+        try:
+            self._make_dir(client_kwargs)
+        finally:
+            self.invalidate_header(client_kwargs=client_kwargs)
 
     def _make_dir(self, client_kwargs):
         """
@@ -553,7 +638,11 @@ class SystemBase(ABC, WorkerPoolBase):
         """
         if not relative:
             path = self.relpath(path)
-        self._remove(self.get_client_kwargs(path))
+        client_kwargs = self.get_client_kwargs(path)
+        try:
+            self._remove(client_kwargs)
+        finally:
+            self.invalidate_header(client_kwargs=client_kwargs)
 
     def _remove(self, client_kwargs):
         """
@@ -625,6 +714,9 @@ class SystemBase(ABC, WorkerPoolBase):
         else:
             generator = self._list_all_levels(generator, path, seats)
 
+        if self._header_cache is not None and path:
+            generator = self._cache_listed_headers(generator, path)
+
         take_seat = seats.take_seat
         for item in generator:
             yield item
@@ -632,10 +724,40 @@ class SystemBase(ABC, WorkerPoolBase):
             if seats.full:
                 return
 
+    def _cache_listed_headers(self, generator, path):
+        """
+        Put headers of listed objects in the headers cache.
+
+        Only headers containing the object size are cached, to ensure they can be used
+        in place of the header returned by "head".
+
+        Args:
+            generator (iterable of tuple): object path str, object header dict
+            path (str): Path being listed.
+
+        Yields:
+            tuple: object path str, object header dict
+        """
+        path = path.rstrip("/")
+        size_keys = self._SIZE_KEYS
+        cache_set = self._header_cache.set
+        get_client_kwargs = self.get_client_kwargs
+        header_cache_key = self._header_cache_key
+
+        for obj_path, header in generator:
+            if not obj_path.endswith("/") and any(key in header for key in size_keys):
+                key = header_cache_key(get_client_kwargs("/".join((path, obj_path))))
+                if key is not None:
+                    cache_set(key, header.copy())
+            yield obj_path, header
+
     def _list_all_levels(self, generator, path, seats):
         """
         Recursively yields all level entries.
 
+        Sub directories are listed concurrently in background, while entries are
+        yielded in the same order as a sequential walk of the tree.
+
         Args:
             generator (iterable of tuple): path str, header dict, directory bool
             path (str): Path being listed.
@@ -644,44 +766,84 @@ class SystemBase(ABC, WorkerPoolBase):
         Yields:
             tuple: object path str, object header dict
         """
-        dirs = list()
-        add_dir = dirs.append
-        for obj_path, header, is_dir in generator:
-
-            if not obj_path:
-                # Do not yield itself
-                continue
-
-            if is_dir:
-                add_dir(obj_path)
-                obj_path = obj_path.rstrip("/") + "/"
-
-            yield obj_path, header
+        max_prefetch = self.LIST_MAX_WORKERS
+        workers_submit = WorkerQueue(self._storage, max_prefetch).submit
+        list_objects = self._list_objects
+        get_client_kwargs = self.get_client_kwargs
+
+        # Directories to list, last to list first. Each item is a list of: Prefix to
+        # add to yielded paths, path of the directory, entries generator or future.
+        stack = [["", path, generator]]
+        prefetched = 0
+
+        def list_dir(full_path):
+            """
+            List a directory in background.
+
+            Args:
+                full_path (str): Path of the directory.
+
+            Returns:
+                concurrent.futures.Future: Future of the list of entries.
+            """
+            max_results = seats.seats_left
+            if max_results:
+                # Add an extra seat to ensure the good count when yielding itself
+                max_results += 1
+
+            return workers_submit(
+                lambda: list(
+                    list_objects(
+                        get_client_kwargs(full_path), full_path, max_results, False
+                    )
+                )
+            )
 
-        if dirs:
-            path = path.rstrip("/")
-            for sub_path in dirs:
-                if path:
-                    full_path = "/".join((path, sub_path))
-                else:
-                    full_path = sub_path
-
-                max_results = seats.seats_left
-                if max_results:
-                    # Add an extra seat to ensure the good count when yielding itself
-                    max_results += 1
-
-                for obj_path, header in self._list_all_levels(
-                    self._list_objects(
-                        self.get_client_kwargs(full_path),
-                        full_path,
-                        max_results,
-                        False,
-                    ),
-                    full_path,
-                    seats,
-                ):
-                    yield "/".join((sub_path.rstrip("/"), obj_path)), header
+        try:
+            while stack:
+                prefix, path, entries = stack.pop()
+                if entries is None:
+                    entries = list_dir(path).result()
+                elif isinstance(entries, Future):
+                    prefetched -= 1
+                    entries = entries.result()
+
+                dirs = list()
+                add_dir = dirs.append
+                for obj_path, header, is_dir in entries:
+
+                    if not obj_path:
+                        # Do not yield itself
+                        continue
+
+                    if is_dir:
+                        add_dir(obj_path)
+                        obj_path = obj_path.rstrip("/") + "/"
+
+                    yield prefix + obj_path, header
+
+                path = path.rstrip("/")
+                for sub_path in reversed(dirs):
+                    stack.append(
+                        [
+                            "".join((prefix, sub_path.rstrip("/"), "/")),
+                            "/".join((path, sub_path)) if path else sub_path,
+                            None,
+                        ]
+                    )
+
+                # Start listing of the next directories to yield in background
+                for item in reversed(stack):
+                    if prefetched >= max_prefetch:
+                        break
+                    elif item[2] is None:
+                        item[2] = list_dir(item[1])
+                        prefetched += 1
+
+        finally:
+            for item in stack:
+                if isinstance(item[2], Future):
+                    item[2].cancel()
 
     @staticmethod
     def _list_first_level_only(generator):
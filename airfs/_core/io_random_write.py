@@ -101,7 +101,7 @@ class ObjectBufferedIORandomWriteBase(ObjectBufferedIOBase):
         start = self._buffer_size * (self._seek - 1)
         end = start + len(buffer)
 
-        future = self._workers.submit(
+        future = self._submit_flush(
             self._flush_range, buffer=buffer, start=start, end=end
         )
         self._write_futures.append(future)
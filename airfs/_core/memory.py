@@ -0,0 +1,158 @@
+"""
+Memory budget and buffer pool shared by all buffered streams.
+
+Buffers preloaded in read mode, and buffers awaiting flush in write mode, are accounted
+in a single process wide budget. When the budget is used up, read-ahead stops
+preloading new buffers and writes wait until previous buffers are flushed.
+
+Write buffers are recycled in a pool once flushed, to avoid allocating a new buffer for
+each part.
+"""
+from threading import Condition, Lock
+
+#: Maximum size in bytes of buffers held by all buffered streams (0 for no limit)
+MAX_MEMORY = 0
+
+#: Maximum size in bytes of unused buffers kept in the pool for reuse
+MAX_POOL_MEMORY = 67108864
+
+_CONDITION = Condition()
+_USAGE = 0
+
+_POOL_LOCK = Lock()
+_POOL = dict()
+_POOL_SIZE = 0
+
+
+def _available(size):
+    """
+    Check if memory is available in the budget. Must be called with the condition
+    lock acquired.
+
+    Args:
+        size (int): Size in bytes.
+
+    Returns:
+        bool: True if available.
+    """
+    # If nothing is used, always allow one buffer to ensure progress even if the
+    # budget is lower than a buffer size.
+    return not MAX_MEMORY or not _USAGE or _USAGE + size <= MAX_MEMORY
+
+
+def acquire(size, blocking=True, pending=None):
+    """
+    Acquire memory from the budget.
+
+    Args:
+        size (int): Size in bytes.
+        blocking (bool): If True, wait until memory is available. If False, returns
+            immediately.
+        pending (callable): If specified with "blocking", stop waiting and acquire
+            memory anyway once this function returns False. This is used to ensure
+            progress of a caller that has no more memory to release.
+
+    Returns:
+        bool: True if memory was acquired.
+    """
+    global _USAGE
+    with _CONDITION:
+        while not _available(size):
+            if not blocking:
+                return False
+            elif pending is not None and not pending():
+                break
+            _CONDITION.wait()
+
+        _USAGE += size
+        return True
+
+
+def reserve(size):
+    """
+    Account memory in the budget, without waiting for it to be available.
+
+    Args:
+        size (int): Size in bytes.
+    """
+    global _USAGE
+    with _CONDITION:
+        _USAGE += size
+
+
+def release(size):
+    """
+    Release memory to the budget.
+
+    Args:
+        size (int): Size in bytes.
+    """
+    global _USAGE
+    with _CONDITION:
+        _USAGE -= size
+        _CONDITION.notify_all()
+
+
+def memory_usage():
+    """
+    Size of buffers currently held by all buffered streams.
+
+    Returns:
+        int: Size in bytes.
+    """
+    with _CONDITION:
+        return _USAGE
+
+
+def get_buffer(size):
+    """
+    Get a write buffer from the pool, or allocate a new one.
+
+    Buffers from the pool are not cleared and may contain previous data.
+
+    Args:
+        size (int): Size in bytes.
+
+    Returns:
+        bytearray: Buffer.
+    """
+    global _POOL_SIZE
+    with _POOL_LOCK:
+        try:
+            buffer = _POOL[size].pop()
+        except (KeyError, IndexError):
+            pass
+        else:
+            _POOL_SIZE -= size
+            return buffer
+    return bytearray(size)
+
+
+def recycle_buffer(buffer):
+    """
+    Put a no longer used write buffer in the pool.
+
+    The buffer must not be used by the caller after this call.
+
+    Args:
+        buffer (bytearray): Buffer.
+    """
+    global _POOL_SIZE
+    size = len(buffer)
+    with _POOL_LOCK:
+        if size and _POOL_SIZE + size <= MAX_POOL_MEMORY:
+            try:
+                _POOL[size].append(buffer)
+            except KeyError:
+                _POOL[size] = [buffer]
+            _POOL_SIZE += size
+
+
+def clear_pool():
+    """
+    Release all unused buffers of the pool.
+    """
+    global _POOL_SIZE
+    with _POOL_LOCK:
+        _POOL.clear()
+        _POOL_SIZE = 0
@@ -0,0 +1,248 @@
+"""
+Shared worker pool used by all storage streams and systems.
+
+All background tasks (Read-ahead, write-behind, ...) run on a single process wide
+thread pool. Each stream or system submits its tasks to its own queue, and queues of a
+same storage are served in a round-robin order. This bounds the total number of threads
+and in-flight requests, whatever the number of opened files.
+"""
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock, local
+
+#: Maximum number of threads of the shared worker pool (None for Python default)
+MAX_WORKERS = None
+
+#: Maximum number of tasks running concurrently on a storage. Storage names as keys,
+#: maximum values as values. Storages not specified are only limited by MAX_WORKERS.
+STORAGE_MAX_WORKERS = dict()
+
+_LOCK = Lock()
+_LOCAL = local()
+_EXECUTOR = None
+
+#: Queues with pending tasks, per storage
+_QUEUES = dict()
+
+#: Running tasks count, per storage
+_RUNNING = dict()
+
+
+class WorkerQueue:
+    """
+    Tasks queue of a stream or system, running on the shared worker pool.
+
+    This class provides the "submit" method of "concurrent.futures.Executor".
+
+    Args:
+        storage (str): Storage name.
+        max_workers (int): The maximum number of tasks of this queue that can run
+            concurrently. None for no limit.
+    """
+
+    __slots__ = ("_storage", "_max_workers", "_pending", "_running")
+
+    def __init__(self, storage=None, max_workers=None):
+        self._storage = storage
+        self._max_workers = max_workers
+        self._pending = deque()
+        self._running = 0
+
+    def submit(self, function, *args, **kwargs):
+        """
+        Schedules the callable to be executed.
+
+        Args:
+            function (callable): Function to call.
+            args: Function positional arguments.
+            kwargs: Function keyword arguments.
+
+        Returns:
+            concurrent.futures.Future: Future representing the call execution.
+        """
+        future = Future()
+
+        if getattr(_LOCAL, "is_worker", False):
+            # Tasks submitted from a worker run immediately in this worker to avoid
+            # dead-locking the pool with tasks waiting for queued tasks.
+            future.set_running_or_notify_cancel()
+            _run_task(future, function, args, kwargs)
+            return future
+
+        with _LOCK:
+            self._pending.append((future, function, args, kwargs))
+            if len(self._pending) == 1:
+                try:
+                    _QUEUES[self._storage].append(self)
+                except KeyError:
+                    _QUEUES[self._storage] = deque((self,))
+
+        _dispatch(self._storage)
+        return future
+
+
+def _get_executor():
+    """
+    Get the shared thread pool executor, create it if required.
+
+    Returns:
+        concurrent.futures.ThreadPoolExecutor: Executor
+    """
+    global _EXECUTOR
+    with _LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=MAX_WORKERS, thread_name_prefix="airfs"
+            )
+        return _EXECUTOR
+
+
+def _dispatch(storage):
+    """
+    Start pending tasks of a storage, while concurrency limits allow it.
+
+    Args:
+        storage (str): Storage name.
+    """
+    tasks = []
+    with _LOCK:
+        queues = _QUEUES.get(storage)
+        max_workers = STORAGE_MAX_WORKERS.get(storage)
+        running = _RUNNING.get(storage, 0)
+
+        while queues and (not max_workers or running < max_workers):
+
+            # Find the next queue allowed to run a task, in round-robin order
+            for _ in range(len(queues)):
+                queue = queues[0]
+                if queue._max_workers and queue._running >= queue._max_workers:
+                    queues.rotate(-1)
+                    continue
+                break
+            else:
+                break
+
+            queues.popleft()
+            future, function, args, kwargs = queue._pending.popleft()
+            if queue._pending:
+                queues.append(queue)
+
+            if not future.set_running_or_notify_cancel():
+                # Cancelled before starting
+                continue
+
+            queue._running += 1
+            running += 1
+            tasks.append((queue, future, function, args, kwargs))
+
+        _RUNNING[storage] = running
+
+    if tasks:
+        executor = _get_executor()
+        for task in tasks:
+            try:
+                executor.submit(_run_worker, *task)
+            except RuntimeError as exception:
+                # Executor is shutting down
+                _release(task[0])
+                task[1].set_exception(exception)
+
+
+def _run_worker(queue, future, function, args, kwargs):
+    """
+    Run a task in a worker thread and start next pending tasks.
+
+    Args:
+        queue (WorkerQueue): Queue of the task.
+        future (concurrent.futures.Future): Task future.
+        function (callable): Function to call.
+        args (tuple): Function positional arguments.
+        kwargs (dict): Function keyword arguments.
+    """
+    _LOCAL.is_worker = True
+    try:
+        _run_task(future, function, args, kwargs, queue)
+    finally:
+        _LOCAL.is_worker = False
+        _dispatch(queue._storage)
+
+
+def _run_task(future, function, args, kwargs, queue=None):
+    """
+    Run a task and set its future result.
+
+    Args:
+        future (concurrent.futures.Future): Task future.
+        function (callable): Function to call.
+        args (tuple): Function positional arguments.
+        kwargs (dict): Function keyword arguments.
+        queue (WorkerQueue): Queue of the task to release before setting the result.
+    """
+    try:
+        result = function(*args, **kwargs)
+    except BaseException as exception:
+        if queue is not None:
+            _release(queue)
+        future.set_exception(exception)
+    else:
+        if queue is not None:
+            _release(queue)
+        future.set_result(result)
+
+
+def _release(queue):
+    """
+    Release a running task seat.
+
+    Args:
+        queue (WorkerQueue): Queue of the task.
+    """
+    with _LOCK:
+        queue._running -= 1
+        _RUNNING[queue._storage] -= 1
+
+
+def running_tasks(storage=None):
+    """
+    Number of tasks currently running.
+
+    Args:
+        storage (str): If specified, count only tasks of this storage.
+
+    Returns:
+        int: Running tasks.
+    """
+    with _LOCK:
+        if storage is None:
+            return sum(_RUNNING.values())
+        return _RUNNING.get(storage, 0)
+
+
+def shutdown(wait=True, cancel_pending=False):
+    """
+    Shutdown the shared worker pool.
+
+    The pool is created again if a new task is submitted after the shutdown.
+
+    Args:
+        wait (bool): If True, wait until running tasks are completed.
+        cancel_pending (bool): If True, cancel tasks not started yet.
+    """
+    global _EXECUTOR
+    cancelled = []
+    with _LOCK:
+        if cancel_pending:
+            for queues in _QUEUES.values():
+                for queue in queues:
+                    cancelled.extend(task[0] for task in queue._pending)
+                    queue._pending.clear()
+            _QUEUES.clear()
+
+        executor = _EXECUTOR
+        _EXECUTOR = None
+
+    for future in cancelled:
+        future.cancel()
+
+    if executor is not None:
+        executor.shutdown(wait=wait)
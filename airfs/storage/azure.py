@@ -3,7 +3,8 @@ from abc import abstractmethod as _abstractmethod
 from contextlib import contextmanager as _contextmanager
 from concurrent.futures import as_completed as _as_completed
 from datetime import datetime as _datetime, timedelta as _timedelta
-from io import BytesIO as _BytesIO
+from io import BytesIO as _BytesIO, RawIOBase as _RawIOBase
+from os import SEEK_CUR as _SEEK_CUR, SEEK_END as _SEEK_END, SEEK_SET as _SEEK_SET
 from threading import Lock as _Lock
 
 from azure.common import AzureHttpError as _AzureHttpError  # type: ignore
@@ -239,6 +240,90 @@ class _AzureBaseSystem(_SystemBase):
         return result
 
 
+class _MemoryViewWriter(_RawIOBase):
+    """
+    Writable stream over a pre-allocated buffer, used to download data directly into
+    it.
+
+    Args:
+        b_view (memoryview): Buffer of bytes format.
+    """
+
+    def __init__(self, b_view):
+        _RawIOBase.__init__(self)
+        self._view = b_view
+        self._seek = 0
+
+        #: Size of data written in buffer
+        self.size = 0
+
+    def writable(self):
+        """
+        Return True if the stream supports writing.
+
+        Returns:
+            bool: Supports writing.
+        """
+        return True
+
+    def seekable(self):
+        """
+        Return True if the stream supports random access.
+
+        Returns:
+            bool: Supports random access.
+        """
+        return True
+
+    def seek(self, offset, whence=_SEEK_SET):
+        """
+        Change the stream position to the given byte offset.
+
+        Args:
+            offset (int): Offset is interpreted relative to the position indicated by
+                whence.
+            whence (int): SEEK_SET, SEEK_CUR or SEEK_END.
+
+        Returns:
+            int: The new absolute position.
+        """
+        if whence == _SEEK_CUR:
+            offset += self._seek
+        elif whence == _SEEK_END:
+            offset += len(self._view)
+        self._seek = offset
+        return offset
+
+    def tell(self):
+        """
+        Return the current stream position.
+
+        Returns:
+            int: Stream position.
+        """
+        return self._seek
+
+    def write(self, b):
+        """
+        Write the given bytes-like object in the buffer. Data beyond the buffer end
+        are ignored.
+
+        Args:
+            b (bytes-like object): Bytes to write.
+
+        Returns:
+            int: The number of bytes written.
+        """
+        start = self._seek
+        end = min(start + len(b), len(self._view))
+        size = max(end - start, 0)
+        if size:
+            self._view[start:end] = memoryview(b)[:size]
+            self.size = max(self.size, end)
+        self._seek = start + size
+        return size
+
+
 class _AzureStorageRawIOBase(_ObjectRawIOBase):
     """
     Common Raw IO for all Azure storage classes
@@ -266,6 +351,39 @@ class _AzureStorageRawIOBase(_ObjectRawIOBase):
             bytes: number of bytes read
         """
         stream = _BytesIO()
+        if not self._read_range_to_stream(stream, start, end):
+            return bytes()
+        return stream.getvalue()
+
+    def _read_range_into(self, start, b_view):
+        """
+        Read a range of bytes in stream into a pre-allocated buffer.
+
+        Args:
+            start (int): Start stream position.
+            b_view (memoryview): Buffer of bytes format. The buffer size defines the
+                end stream position.
+
+        Returns:
+            int: number of bytes read
+        """
+        stream = _MemoryViewWriter(b_view)
+        if not self._read_range_to_stream(stream, start, start + len(b_view)):
+            return 0
+        return stream.size
+
+    def _read_range_to_stream(self, stream, start, end=0):
+        """
+        Read a range of bytes in stream and write it to a file-like object.
+
+        Args:
+            stream (file-like object): Destination stream.
+            start (int): Start stream position.
+            end (int): End stream position. 0 To not specify end.
+
+        Returns:
+            bool: False if the range is out of the object.
+        """
         try:
             with _handle_azure_exception():
                 self._get_to_stream(
@@ -277,10 +395,10 @@ class _AzureStorageRawIOBase(_ObjectRawIOBase):
 
         except _AzureHttpError as exception:
             if exception.status_code == 416:
-                return bytes()
+                return False
             raise
 
-        return stream.getvalue()
+        return True
 
     def _readall(self):
         """
@@ -310,7 +428,7 @@ class _AzureStorageRawIORangeWriteBase(
         self._content_length = kwargs.get("content_length", 0)
 
         _ObjectRawIORandomWriteBase.__init__(self, *args, **kwargs)
-        _WorkerPoolBase.__init__(self)
+        _WorkerPoolBase.__init__(self, storage=self._system.storage)
 
         if self._writable:
             self._size_lock = _Lock()
@@ -120,7 +120,7 @@ class AzureAppendBlobBufferedIO(AzureBlobBufferedIO, ObjectBufferedIORandomWrite
         Flush the write buffer of the stream.
         """
         self._write_futures.append(
-            self._workers.submit(
+            self._submit_flush(
                 self._client.append_block,
                 block=self._get_buffer().tobytes(),
                 **self._client_kwargs
@@ -6,7 +6,7 @@ from azure.storage.blob import BlobBlock  # type: ignore
 from azure.storage.blob.models import _BlobTypes  # type: ignore
 
 from airfs.storage.azure import _handle_azure_exception
-from airfs._core.io_base import memoizedmethod
+from airfs._core.io_base import memoizedmethod, MemoryViewReader
 from airfs.io import ObjectBufferedIOBase
 from airfs.storage.azure_blob._base_blob import (
     AzureBlobRawIO,
@@ -113,9 +113,9 @@ class AzureBlockBlobBufferedIO(AzureBlobBufferedIO):
         block_id = self._get_random_block_id(32)
 
         self._write_futures.append(
-            self._workers.submit(
+            self._submit_flush(
                 self._client.put_block,
-                block=self._get_buffer().tobytes(),
+                block=MemoryViewReader(self._get_buffer()),
                 block_id=block_id,
                 **self._client_kwargs,
             )
@@ -6,7 +6,11 @@ from azure.storage.blob.models import _BlobTypes  # type: ignore
 
 from airfs.storage.azure import _AzureStorageRawIORangeWriteBase
 from airfs._core.io_base import memoizedmethod
-from airfs.io import ObjectBufferedIORandomWriteBase, ObjectRawIORandomWriteBase
+from airfs.io import (
+    ObjectBufferedIORandomWriteBase,
+    ObjectRawIOBase,
+    ObjectRawIORandomWriteBase,
+)
 from airfs.storage.azure_blob._base_blob import (
     AzureBlobRawIO,
     AzureBlobBufferedIO,
@@ -45,6 +49,9 @@ class AzurePageBlobRawIO(AzureBlobRawIO, _AzureStorageRawIORangeWriteBase):
     #: Maximum size of one flush operation
     MAX_FLUSH_SIZE = PageBlobService.MAX_PAGE_SIZE
 
+    #: Disabled, ranges are null stripped and can't be assembled
+    READALL_PARALLEL_THRESHOLD = 0
+
     def __init__(self, *args, **kwargs):
         self._ignore_padding = kwargs.get("ignore_padding", True)
         _AzureStorageRawIORangeWriteBase.__init__(self, *args, **kwargs)
@@ -133,6 +140,21 @@ class AzurePageBlobRawIO(AzureBlobRawIO, _AzureStorageRawIORangeWriteBase):
 
         return data
 
+    def _read_range_into(self, start, b_view):
+        """
+        Read a range of bytes in stream into a pre-allocated buffer.
+
+        Args:
+            start (int): Start stream position.
+            b_view (memoryview): Buffer of bytes format. The buffer size defines the
+                end stream position.
+
+        Returns:
+            int: number of bytes read
+        """
+        # Use "_read_range" to strip padding
+        return ObjectRawIOBase._read_range_into(self, start, b_view)
+
     def _readall(self):
         """
         Read and return all the bytes from the stream until EOF.
@@ -274,7 +296,7 @@ class AzurePageBlobBufferedIO(AzureBlobBufferedIO, ObjectBufferedIORandomWriteBa
         start = self._buffer_size * (self._seek - 1)
 
         self._write_futures.append(
-            self._workers.submit(
+            self._submit_flush(
                 self._raw_flush, buffer=buffer, start=start, end=start + len(buffer)
             )
         )
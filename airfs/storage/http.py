@@ -133,6 +133,36 @@ class HTTPRawIO(_ObjectRawIOBase):
 
         return _handle_http_errors(response).content
 
+    def _read_range_into(self, start, b_view):
+        """
+        Read a range of bytes in stream into a pre-allocated buffer.
+
+        Args:
+            start (int): Start stream position.
+            b_view (memoryview): Buffer of bytes format. The buffer size defines the
+                end stream position.
+
+        Returns:
+            int: number of bytes read
+        """
+        response = self._client.request(
+            "GET",
+            self.name,
+            headers=dict(Range=self._http_range(start, start + len(b_view))),
+            timeout=self._TIMEOUT,
+            stream=True,
+        )
+        try:
+            if response.status_code == 416:
+                return 0
+
+            return self._readinto_from_stream(
+                _handle_http_errors(response).iter_content(self._STREAM_CHUNK_SIZE),
+                b_view,
+            )
+        finally:
+            response.close()
+
     def _readall(self):
         """
         Read and return all the bytes from the stream until EOF.
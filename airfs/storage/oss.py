@@ -6,7 +6,10 @@ import oss2 as _oss  # type: ignore
 from oss2.models import PartInfo as _PartInfo  # type: ignore
 from oss2.exceptions import OssError as _OssError  # type: ignore
 
-from airfs._core.io_base import memoizedmethod as _memoizedmethod
+from airfs._core.io_base import (
+    memoizedmethod as _memoizedmethod,
+    MemoryViewReader as _MemoryViewReader,
+)
 from airfs._core.exceptions import (
     ObjectNotFoundError as _ObjectNotFoundError,
     ObjectPermissionError as _ObjectPermissionError,
@@ -58,6 +61,7 @@ class _OSSSystem(_SystemBase):
 
     SUPPORTS_SYMLINKS = True
 
+    _SIZE_KEYS = ("Content-Length", "size")
     _CTIME_KEYS = ("Creation-Date", "creation_date")
     _MTIME_KEYS = ("Last-Modified", "last_modified")
 
@@ -405,8 +409,41 @@ class OSSRawIO(_ObjectRawIOBase):
             # EOF. Do not detect using 416 (Out of range) error, 200 returned.
             return bytes()
 
+        return self._get_range(start, end).read()
+
+    def _read_range_into(self, start, b_view):
+        """
+        Read a range of bytes in stream into a pre-allocated buffer.
+
+        Args:
+            start (int): Start stream position.
+            b_view (memoryview): Buffer of bytes format. The buffer size defines the
+                end stream position.
+
+        Returns:
+            int: number of bytes read
+        """
+        if start >= self._size:
+            # EOF. Do not detect using 416 (Out of range) error, 200 returned.
+            return 0
+
+        response = self._get_range(start, start + len(b_view))
         with _handle_oss_error():
-            response = self._bucket.get_object(
+            return self._readinto_from_stream(response, b_view)
+
+    def _get_range(self, start, end):
+        """
+        Get a range of bytes in stream.
+
+        Args:
+            start (int): Start stream position.
+            end (int): End stream position. 0 To not specify end.
+
+        Returns:
+            oss2.models.GetObjectResult: Response.
+        """
+        with _handle_oss_error():
+            return self._bucket.get_object(
                 key=self._key,
                 headers=dict(
                     Range=self._http_range(
@@ -416,8 +453,6 @@ class OSSRawIO(_ObjectRawIOBase):
                 ),
             )
 
-        return response.read()
-
     def _readall(self):
         """
         Read and return all the bytes from the stream until EOF.
@@ -436,7 +471,7 @@ class OSSRawIO(_ObjectRawIOBase):
             buffer (memoryview): Buffer content.
         """
         with _handle_oss_error():
-            self._bucket.put_object(key=self._key, data=buffer.tobytes())
+            self._bucket.put_object(key=self._key, data=_MemoryViewReader(buffer))
 
 
 class OSSBufferedIO(_ObjectBufferedIOBase):
@@ -480,12 +515,12 @@ class OSSBufferedIO(_ObjectBufferedIOBase):
                     self._key
                 ).upload_id
 
-        response = self._workers.submit(
+        response = self._submit_flush(
             self._bucket.upload_part,
             key=self._key,
             upload_id=self._upload_id,
             part_number=self._seek,
-            data=self._get_buffer().tobytes(),
+            data=_MemoryViewReader(self._get_buffer()),
         )
 
         self._write_futures.append(dict(response=response, part_number=self._seek))
@@ -62,7 +62,7 @@ class _S3System(_SystemBase):
 
     __slots__ = ("_session",)
 
-    _SIZE_KEYS = ("ContentLength",)
+    _SIZE_KEYS = ("ContentLength", "Size")
     _CTIME_KEYS = ("CreationDate",)
     _MTIME_KEYS = ("LastModified",)
 
@@ -383,19 +383,49 @@ class S3RawIO(_ObjectRawIOBase):
         Returns:
             bytes: number of bytes read
         """
+        body = self._get_range_body(start, end)
+        return body.read() if body is not None else bytes()
+
+    def _read_range_into(self, start, b_view):
+        """
+        Read a range of bytes in stream into a pre-allocated buffer.
+
+        Args:
+            start (int): Start stream position.
+            b_view (memoryview): Buffer of bytes format. The buffer size defines the
+                end stream position.
+
+        Returns:
+            int: number of bytes read
+        """
+        body = self._get_range_body(start, start + len(b_view))
+        if body is None:
+            return 0
+        return self._readinto_from_stream(body, b_view)
+
+    def _get_range_body(self, start, end):
+        """
+        Get the body of a range of bytes in stream.
+
+        Args:
+            start (int): Start stream position.
+            end (int): End stream position. 0 To not specify end.
+
+        Returns:
+            botocore.response.StreamingBody: Body, or None if the range is out of the
+                object.
+        """
         try:
             with _handle_client_error():
-                response = self._client.get_object(
+                return self._client.get_object(
                     Range=self._http_range(start, end), **self._client_kwargs
-                )
+                )["Body"]
 
         except _ClientError as exception:
             if exception.response["Error"]["Code"] == "InvalidRange":
-                return bytes()
+                return None
             raise
 
-        return response["Body"].read()
-
     def _readall(self):
         """
         Read and return all the bytes from the stream until EOF.
@@ -413,8 +443,12 @@ class S3RawIO(_ObjectRawIOBase):
         Args:
             buffer (memoryview): Buffer content.
         """
+        body = buffer.obj
+        if not isinstance(body, (bytes, bytearray)) or len(body) != len(buffer):
+            body = buffer.tobytes()
+
         with _handle_client_error():
-            self._client.put_object(Body=buffer.tobytes(), **self._client_kwargs)
+            self._client.put_object(Body=body, **self._client_kwargs)
 
 
 class S3BufferedIO(_ObjectBufferedIOBase):
@@ -460,9 +494,9 @@ class S3BufferedIO(_ObjectBufferedIOBase):
                     **self._client_kwargs
                 )["UploadId"]
 
-        response = self._workers.submit(
+        response = self._submit_flush(
             self._client.upload_part,
-            Body=self._get_buffer().tobytes(),
+            Body=self._get_buffer_object(),
             PartNumber=self._seek,
             **self._upload_args,
         )
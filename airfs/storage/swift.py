@@ -287,16 +287,53 @@ class SwiftRawIO(_ObjectRawIOBase):
         Returns:
             bytes: number of bytes read
         """
+        return self._get_range(start, end) or b""
+
+    def _read_range_into(self, start, b_view):
+        """
+        Read a range of bytes in stream into a pre-allocated buffer.
+
+        Args:
+            start (int): Start stream position.
+            b_view (memoryview): Buffer of bytes format. The buffer size defines the
+                end stream position.
+
+        Returns:
+            int: number of bytes read
+        """
+        chunks = self._get_range(
+            start, start + len(b_view), resp_chunk_size=self._STREAM_CHUNK_SIZE
+        )
+        if chunks is None:
+            return 0
+        with _handle_client_exception():
+            return self._readinto_from_stream(chunks, b_view)
+
+    def _get_range(self, start, end=0, **kwargs):
+        """
+        Get a range of bytes in stream.
+
+        Args:
+            start (int): Start stream position.
+            end (int): End stream position. 0 To not specify end.
+            kwargs: "swiftclient.client.Connection.get_object" keyword arguments.
+
+        Returns:
+            bytes or generator of bytes: Content, or None if the range is out of the
+                object.
+        """
         try:
             with _handle_client_exception():
                 return self._client.get_object(
-                    *self._client_args, headers=dict(Range=self._http_range(start, end))
+                    *self._client_args,
+                    headers=dict(Range=self._http_range(start, end)),
+                    **kwargs,
                 )[1]
 
         except _ClientException as exception:
             if exception.http_status == 416:
                 # EOF
-                return b""
+                return None
             raise
 
     def _readall(self):
@@ -354,7 +391,7 @@ class SwiftBufferedIO(_ObjectBufferedIOBase):
         Flush the write buffers of the stream.
         """
         name = self._segment_name % self._seek
-        response = self._workers.submit(
+        response = self._submit_flush(
             self._client.put_object, self._container, name, self._get_buffer()
         )
 
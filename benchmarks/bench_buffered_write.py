@@ -0,0 +1,129 @@
+#! /usr/bin/env python3
+"""
+Benchmark of buffered streams write with write-behind backpressure ("max_buffers").
+
+Writes many small parts to a local mock storage with a simulated upload latency, and
+compares the event driven backpressure with the previous sleep polling
+implementation.
+
+run "python -m benchmarks.bench_buffered_write --help" from the repository root
+for help.
+"""
+from argparse import ArgumentParser
+from time import perf_counter, sleep
+
+from airfs._core.io_base_buffered import ObjectBufferedIOBase
+from airfs._core.io_base_raw import ObjectRawIOBase
+
+
+class MockSystem:
+    """Mock storage system"""
+
+    client = None
+    storage = "benchmark"
+
+    def __init__(self, **_):
+        """Do nothing"""
+
+    @staticmethod
+    def relpath(path):
+        """Returns path"""
+        return path
+
+    @staticmethod
+    def get_client_kwargs(*_, **__):
+        """Returns empty client arguments"""
+        return {}
+
+    @staticmethod
+    def invalidate_header(*_, **__):
+        """Do nothing"""
+
+
+class MockRawIO(ObjectRawIOBase):
+    """Mock raw IO"""
+
+    _SYSTEM_CLASS = MockSystem
+
+    def _flush(self, *_):
+        """Do nothing"""
+
+    def _read_range(self, *_, **__):
+        """Do nothing"""
+
+
+class MockBufferedIO(ObjectBufferedIOBase):
+    """Mock buffered IO, with simulated upload latency"""
+
+    _RAW_CLASS = MockRawIO
+
+    #: Simulated upload latency in seconds
+    latency = 0.0
+
+    def _upload(self, _):
+        """Simulate a part upload"""
+        sleep(self.latency)
+
+    def _flush(self):
+        """Flush"""
+        self._write_futures.append(
+            self._submit_flush(self._upload, self._get_buffer().tobytes())
+        )
+
+
+class PollingBufferedIO(MockBufferedIO):
+    """Mock buffered IO, with the previous sleep polling backpressure"""
+
+    def _submit_flush(self, function, *args, **kwargs):
+        """Wait until less than "max_buffers" flushes are pending, then submit"""
+        futures = self._write_futures
+        while sum(1 for future in futures if not future.done()) >= self._max_buffers:
+            sleep(self._FLUSH_WAIT)
+        return self._workers.submit(function, *args, **kwargs)
+
+
+def run(cls, parts, part_size, max_buffers, latency):
+    """
+    Write parts and returns the throughput.
+
+    Args:
+        cls (type): Buffered IO class.
+        parts (int): Number of parts.
+        part_size (int): Part size in bytes.
+        max_buffers (int): Maximum number of parts awaiting flush.
+        latency (float): Simulated upload latency in seconds.
+
+    Returns:
+        float: Parts per second.
+    """
+    cls.latency = latency
+    data = b"0" * part_size
+    start = perf_counter()
+    with cls(
+        "benchmark", mode="w", buffer_size=part_size, max_buffers=max_buffers
+    ) as file:
+        for _ in range(parts):
+            file.write(data)
+    return parts / (perf_counter() - start)
+
+
+def _main():
+    """Run the benchmark"""
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--parts", type=int, default=2000, help="Number of parts")
+    parser.add_argument("--part-size", type=int, default=1024, help="Part size")
+    parser.add_argument("--max-buffers", type=int, default=8, help="max_buffers")
+    parser.add_argument(
+        "--latency", type=float, default=0.001, help="Upload latency in seconds"
+    )
+    args = parser.parse_args()
+
+    for name, cls in (("sleep polling", PollingBufferedIO), ("event", MockBufferedIO)):
+        throughput = run(
+            cls, args.parts, args.part_size, args.max_buffers, args.latency
+        )
+        print(f"{name:>15}: {throughput:10.0f} parts/s")
+
+
+if __name__ == "__main__":
+    _main()
@@ -69,3 +69,41 @@ def test_cache(tmpdir):
         cache.CACHE_DIR = cache_dir
         cache.CACHE_LONG_EXPIRY = long_expiry
         cache.CACHE_SHORT_EXPIRY = short_expiry
+
+
+def test_memory_cache():
+    """Test airfs._core.cache.MemoryCache"""
+    from airfs._core.cache import MemoryCache, NoCacheException
+    from time import sleep
+
+    # Test simple set and get
+    cache = MemoryCache(max_size=2)
+    cache.set("key1", 1)
+    assert cache.get("key1") == 1
+    with pytest.raises(NoCacheException):
+        cache.get("key2")
+
+    # Test least recently used discarded
+    cache.set("key2", 2)
+    cache.get("key1")
+    cache.set("key3", 3)
+    assert len(cache) == 2
+    assert cache.get("key1") == 1
+    with pytest.raises(NoCacheException):
+        cache.get("key2")
+
+    # Test pop and clear
+    cache.pop("key1")
+    cache.pop("key1")
+    with pytest.raises(NoCacheException):
+        cache.get("key1")
+    cache.clear()
+    assert not len(cache)
+
+    # Test expired
+    cache = MemoryCache(expiry=1e-9)
+    cache.set("key1", 1)
+    sleep(0.01)
+    with pytest.raises(NoCacheException):
+        cache.get("key1")
+    assert not len(cache)
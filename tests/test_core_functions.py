@@ -400,6 +400,7 @@ def test_cos_open(tmpdir):
         """dummy system"""
 
         def __init__(self, *_, **__):
+            self._header_cache = None
             self.copied = False
             self.raise_on_copy = False
 
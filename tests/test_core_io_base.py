@@ -53,3 +53,25 @@ def test_memoizedmethod():
     assert dummy.to_memoize(value) == value
     assert dummy._cache == {"to_memoize": value}
     assert dummy.to_memoize(value) == value
+
+
+def test_memory_view_reader():
+    """Tests airfs._core.io_base.MemoryViewReader"""
+    from airfs._core.io_base import MemoryViewReader
+
+    buffer = bytearray(range(100))
+    reader = MemoryViewReader(memoryview(buffer)[:50])
+    assert len(reader) == 50
+    assert reader.read(10) == bytes(range(10))
+    assert reader.tell() == 10
+
+    data = bytearray(20)
+    assert reader.readinto(data) == 20
+    assert data == bytes(range(10, 30))
+
+    assert reader.read() == bytes(range(30, 50))
+    assert reader.read() == b""
+    assert reader.seek(0) == 0
+    assert reader.seek(-5, 2) == 45
+    assert reader.seek(2, 1) == 47
+    assert reader.read(100) == bytes(range(47, 50))
@@ -29,6 +29,7 @@ def test_object_buffered_base_io():
         """Dummy system"""
 
         client = None
+        storage = "dummy"
 
         def __init__(self, **_):
             """Do nothing"""
@@ -53,6 +54,10 @@ def test_object_buffered_base_io():
             """Returns fake result"""
             return {}
 
+        @staticmethod
+        def invalidate_header(*_, **__):
+            """Do nothing"""
+
     class DummyRawIO(ObjectRawIOBase):
         """Dummy IO"""
 
@@ -91,7 +96,7 @@ def test_object_buffered_base_io():
         def _flush(self):
             """Flush"""
             self._write_futures.append(
-                self._workers.submit(flush, self._write_buffer[: self._buffer_seek])
+                self._submit_flush(flush, self._write_buffer[: self._buffer_seek])
             )
 
     class DummyRawIOPartFlush(DummyRawIO, ObjectRawIORandomWriteBase):
@@ -125,15 +130,11 @@ def test_object_buffered_base_io():
     object_io = DummyBufferedIO(name, max_buffers=5)
     assert object_io.read(100) == 100 * b"0"
 
-    # Tests: Read by parts
-    assert sorted(object_io._read_queue) == list(
-        range(100, 100 + buffer_size * 5, buffer_size)
-    )
+    # Tests: Read by parts, read-ahead grows on sequential reads
+    assert sorted(object_io._read_queue) == [100, 200]
     assert object_io._seek == 100
     assert object_io.read(150) == 150 * b"0"
-    assert sorted(object_io._read_queue) == list(
-        range(200, 200 + buffer_size * 5, buffer_size)
-    )
+    assert sorted(object_io._read_queue) == [200, 300, 400]
     assert object_io._seek == 250
     assert object_io.read(50) == 50 * b"0"
     assert sorted(object_io._read_queue) == list(
@@ -150,16 +151,19 @@ def test_object_buffered_base_io():
         assert object_io.read(part) == part * b"0"
         assert object_io._seek == part * index
 
-    # Tests: Read, change seek
+    # Tests: Read, change seek in preloaded buffers
     object_io.seek(450)
+    assert object_io.read(part) == part * b"0"
     assert sorted(object_io._read_queue) == list(
-        range(450, 450 + buffer_size * 5, buffer_size)
+        range(400, 400 + buffer_size * 6, buffer_size)
     )
 
-    object_io.seek(700)
-    assert sorted(object_io._read_queue) == list(
-        range(700, 700 + buffer_size * 5, buffer_size)
-    )
+    # Tests: Read, random seek disables read-ahead
+    object_io.seek(5000)
+    assert object_io.read(part) == part * b"0"
+    assert not object_io._read_queue
+    assert object_io.read(part) == part * b"0"
+    assert sorted(object_io._read_queue) == [5000, 5100]
 
     # Tests: Read buffer size (No copy mode)
     object_io.seek(0)
@@ -169,14 +173,95 @@ def test_object_buffered_base_io():
     assert object_io.read(buffer_size) == b"0" * (buffer_size // 2)
     object_io._seek = size
 
+    # Tests: Close cancels preloading
+    object_io.seek(0)
+    object_io.read(part)
+    object_io.read(part)
+    assert object_io._read_queue
+    object_io.close()
+    assert not object_io._read_queue
+
+    # Tests: Read large parts directly in a pre-allocated buffer
+    from array import array
+
+    object_io = DummyBufferedIO(name)
+    buffer = array("i", bytes(buffer_size * 3))
+    assert object_io.readinto(buffer) == buffer_size * 3
+    assert buffer.tobytes() == buffer_size * 3 * b"0"
+    assert sorted(object_io._read_queue) == [300, 400]
+    object_io.close()
+
+    # Tests: Read lines and small parts from preloaded buffers
+    lines = b"".join(b"line %d\n" % index for index in range(2000))[:size]
+
+    class DummyLinesRawIO(DummyRawIO):
+        """Dummy IO with lines"""
+
+        def _read_range(self, start, end=0):
+            """Read fake lines"""
+            raw_reads.append(start)
+            return lines[start:end]
+
+    class DummyLinesBufferedIO(DummyBufferedIO):
+        """Dummy buffered IO with lines"""
+
+        _RAW_CLASS = DummyLinesRawIO
+
+    raw_reads = []
+    object_io = DummyLinesBufferedIO(name)
+    assert object_io.readline() == b"line 0\n"
+    assert object_io.readline(3) == b"lin"
+    assert object_io.readline() == b"e 1\n"
+    assert object_io.peek(4) == b"line"
+    assert object_io.read1(4) == b"line"
+    assert object_io.read1() == lines[18:buffer_size]
+    assert object_io.tell() == buffer_size
+    readinto1_buffer = bytearray(buffer_size * 2)
+    assert object_io.readinto1(readinto1_buffer) == buffer_size
+    assert readinto1_buffer[:buffer_size] == lines[buffer_size : buffer_size * 2]
+    assert object_io.readlines() == lines[buffer_size * 2 :].splitlines(True)
+    assert sorted(raw_reads) == list(range(0, size, buffer_size))
+    object_io.close()
+
+    # Tests: Read lines after a random seek
+    raw_reads = []
+    object_io = DummyLinesBufferedIO(name)
+    object_io.seek(5005)
+    line = object_io.readline()
+    assert line == lines[5005:].split(b"\n", 1)[0] + b"\n"
+    assert object_io.tell() == 5005 + len(line)
+    assert raw_reads[0] == 5000
+    object_io.close()
+
+    # Tests: Read-ahead limited by memory budget
+    import airfs._core.memory as memory
+
+    usage = memory.memory_usage()
+    memory.MAX_MEMORY = usage + buffer_size * 2
+    try:
+        object_io = DummyBufferedIO(name)
+        for _ in range(10):
+            assert object_io.read(part) == part * b"0"
+            assert len(object_io._read_queue) <= 2
+        object_io.close()
+        assert memory.memory_usage() == usage
+    finally:
+        memory.MAX_MEMORY = 0
+
     # Tests: Read, EOF before theoretical EOF
     def read_range(*_, **__):
         """Returns empty bytes"""
         return b""
 
+    def read_range_into(*_, **__):
+        """Returns no bytes read"""
+        return 0
+
     object_io = DummyBufferedIO(name, max_buffers=5)
     object_io._read_range = read_range
+    object_io._read_range_into = read_range_into
     assert object_io.read() == b""
+    assert object_io.read(part) == b""
 
     # Tests write (with auto flush)
     assert bytes(flushed) == b""
@@ -184,7 +269,8 @@ def test_object_buffered_base_io():
     assert object_io.write(250 * b"0") == 250
     object_io.ensure_ready()
     assert object_io._buffer_seek == 50
-    assert bytes(object_io._write_buffer) == 50 * b"0" + 50 * b"\0"
+    assert len(object_io._write_buffer) == 100
+    assert bytes(object_io._write_buffer[:50]) == 50 * b"0"
     assert object_io._get_buffer().tobytes() == 50 * b"0"
     assert object_io._seek == 2
     assert len(flushed) == 200
@@ -224,8 +310,25 @@ def test_object_buffered_base_io():
     object_io = DummyBufferedIO(name, mode="w", max_buffers=2)
     flush_sleep = object_io._FLUSH_WAIT
     assert object_io.write(1000 * b"0") == 1000
+    assert len(object_io._flush_futures) <= 2
     flush_sleep = 0
 
+    # Test write-behind limited by memory budget
+    object_io.ensure_ready()
+    flushed = bytearray()
+    usage = memory.memory_usage()
+    memory.MAX_MEMORY = usage + buffer_size
+    try:
+        object_io = DummyBufferedIO(name, mode="w")
+        flush_sleep = 0.01
+        assert object_io.write(500 * b"0") == 500
+        flush_sleep = 0
+        object_io.close()
+        assert len(flushed) == 500
+        assert memory.memory_usage() == usage
+    finally:
+        memory.MAX_MEMORY = 0
+
     # Test default implementation with part flush support
     raw_flushed[:] = b""
     content = os.urandom(100)
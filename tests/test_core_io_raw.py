@@ -7,3 +7,112 @@ def test_object_raw_base_io_http_range():
 
     assert ObjectRawIOBase._http_range(10, 50) == "bytes=10-49"
     assert ObjectRawIOBase._http_range(10) == "bytes=10-"
+
+
+def test_object_raw_base_io_readinto_from_stream():
+    """Tests airfs._core.io_raw.ObjectRawIOBase._readinto_from_stream"""
+    from io import BytesIO
+    from airfs._core.io_base_raw import ObjectRawIOBase
+
+    content = bytes(range(100))
+
+    class ReadOnlyStream:
+        """Stream without readinto"""
+
+        def __init__(self):
+            self._stream = BytesIO(content)
+
+        def read(self, size=-1):
+            """Read"""
+            return self._stream.read(size)
+
+    chunks = (content[index : index + 30] for index in range(0, 100, 30))
+
+    for stream in (BytesIO(content), ReadOnlyStream(), chunks):
+        buffer = bytearray(50)
+        assert ObjectRawIOBase._readinto_from_stream(stream, memoryview(buffer)) == 50
+        assert buffer == content[:50]
+
+    buffer = bytearray(150)
+    assert (
+        ObjectRawIOBase._readinto_from_stream(BytesIO(content), memoryview(buffer))
+        == 100
+    )
+    assert buffer[:100] == content
+
+
+def test_object_raw_base_io_readall_parallel():
+    """Tests airfs._core.io_raw.ObjectRawIOBase.readall with parallel ranges"""
+    from airfs._core.io_base_raw import ObjectRawIOBase
+
+    content = bytes(range(256)) * 4
+    size = len(content)
+    ranges = []
+
+    class DummySystem:
+        """Dummy system"""
+
+        client = None
+        storage = "dummy"
+
+        def __init__(self, **_):
+            """Do nothing"""
+
+        @staticmethod
+        def getsize(*_, **__):
+            """Returns fake result"""
+            return size
+
+        @staticmethod
+        def head(*_, **__):
+            """Returns fake result"""
+            return {}
+
+        @staticmethod
+        def get_client_kwargs(*_, **__):
+            """Returns fake result"""
+            return {}
+
+        @staticmethod
+        def invalidate_header(*_, **__):
+            """Do nothing"""
+
+    class DummyRawIO(ObjectRawIOBase):
+        """Dummy IO"""
+
+        _SYSTEM_CLASS = DummySystem
+        READALL_PARALLEL_THRESHOLD = 500
+        READALL_CHUNK_SIZE = 100
+
+        def _flush(self, *_):
+            """Do nothing"""
+
+        def _read_range(self, start, end=0):
+            """Read content"""
+            ranges.append((start, end))
+            return content[start : end or None]
+
+    # Test: Parallel ranges
+    assert DummyRawIO("name").readall() == content
+    assert sorted(ranges) == [
+        (start, min(start + 100, size)) for start in range(0, size, 100)
+    ]
+
+    # Test: Parallel ranges from current position
+    ranges.clear()
+    file = DummyRawIO("name")
+    file.seek(100)
+    assert file.readall() == content[100:]
+    assert file.tell() == size
+    assert len(ranges) == 10
+
+    # Test: Single request under threshold
+    ranges.clear()
+    file = DummyRawIO("name")
+    file.seek(600)
+    assert file.readall() == content[600:]
+    assert ranges == [(600, 0)]
+
+    # Test: EOF before theoretical EOF
+    size = 2000
+    assert DummyRawIO("name").readall() == content
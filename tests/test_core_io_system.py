@@ -51,7 +51,7 @@ def test_system_base():
             """Checks arguments and returns fake result"""
             assert path
             dummy_client_kwargs["path"] = path
-            return dummy_client_kwargs
+            return dummy_client_kwargs.copy()
 
         def _get_client(self):
             """Returns fake result"""
@@ -63,7 +63,8 @@ def test_system_base():
 
         def _list_objects(self, client_kwargs, *_, **__):
             """Checks arguments and returns fake result"""
-            assert client_kwargs == dummy_client_kwargs
+            # Directories may be listed concurrently
+            assert client_kwargs["arg1"] == dummy_client_kwargs["arg1"]
 
             path = client_kwargs["path"].strip("/")
             if path == "locator_no_access":
@@ -238,3 +239,175 @@ def test_system_base():
     assert list(system.list_objects(path="locator", relative=True)) == [
         (obj, object_header) for obj in objects
     ]
+
+
+def test_system_base_header_cache():
+    """Tests airfs._core.io_system.SystemBase headers cache"""
+    from airfs._core.io_base_system import SystemBase
+
+    heads = []
+    removed = []
+
+    class DummySystem(SystemBase):
+        """Dummy System"""
+
+        def get_client_kwargs(self, path):
+            """Returns fake result"""
+            return dict(path=self.relpath(path))
+
+        def _get_client(self):
+            """Returns fake result"""
+
+        def _get_roots(self):
+            """Returns fake result"""
+            return ("root://",)
+
+        def _head(self, client_kwargs):
+            """Returns fake result"""
+            heads.append(client_kwargs["path"])
+            return {"Content-Length": "100"}
+
+        def _make_dir(self, client_kwargs):
+            """Do nothing"""
+
+        def _remove(self, client_kwargs):
+            """Do nothing"""
+            removed.append(client_kwargs["path"])
+
+        def _list_objects(self, client_kwargs, *_, **__):
+            """Returns fake result"""
+            assert client_kwargs["path"] == "locator"
+            yield "listed", {"Content-Length": "10"}, False
+            yield "listed_no_size", {}, False
+
+    # Tests: Disabled by default
+    system = DummySystem()
+    system.getsize("root://path")
+    system.getsize("root://path")
+    assert heads == ["path", "path"]
+
+    # Tests: Cached header
+    heads.clear()
+    system = DummySystem(
+        storage_parameters={
+            "airfs.header_cache_expiry": 60,
+            "airfs.header_cache_max_size": 2,
+        }
+    )
+    assert "airfs.header_cache_expiry" not in system.storage_parameters
+    assert system.exists("root://path")
+    assert system.getsize("root://path") == 100
+    assert system.stat("path").st_size == 100
+    assert heads == ["path"]
+
+    # Tests: Returned headers are copies
+    system.head("root://path")["Content-Length"] = "0"
+    assert system.getsize("root://path") == 100
+
+    # Tests: Least recently used header is discarded
+    system.head("root://path1")
+    system.head("root://path2")
+    system.head("root://path")
+    assert heads == ["path", "path1", "path2", "path"]
+
+    # Tests: Invalidated on changes
+    heads.clear()
+    system.remove("root://path2")
+    system.head("root://path2")
+    system.make_dir("root://path2")
+    system.head("root://path2/")
+    assert heads == ["path2", "path2/"]
+
+    system.invalidate_header("root://path2")
+    system.head("root://path2")
+    system.invalidate_header()
+    system.head("root://path2/")
+    assert heads == ["path2", "path2/", "path2", "path2/"]
+    assert removed == ["path2"]
+
+    # Tests: Headers from listing are cached
+    heads.clear()
+    system.invalidate_header()
+    assert dict(system.list_objects("root://locator", first_level=True)) == {
+        "listed": {"Content-Length": "10"},
+        "listed_no_size": {},
+    }
+    assert system.getsize("root://locator/listed") == 10
+    system.head("root://locator/listed_no_size")
+    assert heads == ["locator/listed_no_size"]
+
+    # Tests: Expired header
+    heads.clear()
+    system = DummySystem(storage_parameters={"airfs.header_cache_expiry": 1e-9})
+    system.head("root://path")
+    system.head("root://path")
+    assert heads == ["path", "path"]
+
+
+def test_system_base_list_all_levels():
+    """Tests airfs._core.io_system.SystemBase concurrent tree listing"""
+    from threading import Lock
+    from airfs._core.io_base_system import SystemBase
+
+    lock = Lock()
+    listed = []
+    tree = {
+        "root": ("a/", "b/", "file0"),
+        "root/a": ("a1/", "file1"),
+        "root/a/a1": ("file2", "file3"),
+        "root/b": ("file4",),
+    }
+
+    class DummySystem(SystemBase):
+        """Dummy System"""
+
+        def get_client_kwargs(self, path):
+            """Returns fake result"""
+            return dict(path=path.rstrip("/"))
+
+        def _get_client(self):
+            """Returns fake result"""
+
+        def _get_roots(self):
+            """Returns fake result"""
+            return ("root://",)
+
+        def _head(self, client_kwargs):
+            """Returns fake result"""
+            return dict()
+
+        def _list_objects(self, client_kwargs, path, max_results, first_level):
+            """Returns fake result"""
+            with lock:
+                listed.append(client_kwargs["path"])
+            time.sleep(0.01)
+            for name in tree[client_kwargs["path"]]:
+                yield name, dict(name=name), name.endswith("/")
+
+    system = DummySystem()
+
+    # Tests: Entries yielded in tree order
+    assert [path for path, _ in system.list_objects("root://root")] == [
+        "a/",
+        "b/",
+        "file0",
+        "a/a1/",
+        "a/file1",
+        "a/a1/file2",
+        "a/a1/file3",
+        "b/file4",
+    ]
+    assert sorted(listed) == sorted(tree)
+
+    # Tests: Sequential listing
+    DummySystem.LIST_MAX_WORKERS = 1
+    assert len(list(system.list_objects("root://root"))) == 8
+
+    # Tests: Max results
+    DummySystem.LIST_MAX_WORKERS = 8
+    assert [path for path, _ in system.list_objects("root://root", max_results=4)] == [
+        "a/",
+        "b/",
+        "file0",
+        "a/a1/",
+    ]
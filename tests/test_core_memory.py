@@ -0,0 +1,74 @@
+"""Test airfs._core.memory"""
+from threading import Thread
+from time import sleep
+
+
+def test_memory_budget():
+    """Tests airfs._core.memory"""
+    import airfs._core.memory as memory
+
+    usage = memory.memory_usage()
+    try:
+        memory.MAX_MEMORY = usage + 100
+
+        # Test: Acquire and release
+        assert memory.acquire(60)
+        assert memory.memory_usage() == usage + 60
+        assert not memory.acquire(60, blocking=False)
+        memory.release(60)
+        assert memory.memory_usage() == usage
+
+        # Test: Reserve without checking the budget
+        memory.reserve(150)
+        assert memory.memory_usage() == usage + 150
+        assert not memory.acquire(10, blocking=False)
+
+        # Test: Stop waiting when no memory is pending release
+        assert memory.acquire(10, pending=lambda: False)
+        memory.release(10)
+
+        # Test: Wait for memory release
+        acquired = []
+        thread = Thread(target=lambda: acquired.append(memory.acquire(50)))
+        thread.start()
+        sleep(0.05)
+        assert not acquired
+        memory.release(150)
+        thread.join()
+        assert acquired == [True]
+        memory.release(50)
+        assert memory.memory_usage() == usage
+
+        # Test: No limit
+        memory.MAX_MEMORY = 0
+        assert memory.acquire(1000, blocking=False)
+        memory.release(1000)
+
+    finally:
+        memory.MAX_MEMORY = 0
+
+
+def test_buffer_pool():
+    """Tests airfs._core.memory buffers pool"""
+    import airfs._core.memory as memory
+
+    memory.clear_pool()
+    max_pool_memory = memory.MAX_POOL_MEMORY
+    try:
+        # Test: Recycle buffers
+        buffer = memory.get_buffer(10)
+        assert len(buffer) == 10
+        memory.recycle_buffer(buffer)
+        assert memory.get_buffer(10) is buffer
+        assert memory.get_buffer(10) is not buffer
+
+        # Test: Pool size limit
+        memory.MAX_POOL_MEMORY = 15
+        memory.recycle_buffer(buffer)
+        memory.recycle_buffer(bytearray(10))
+        assert memory.get_buffer(10) is buffer
+        assert memory.get_buffer(10) is not buffer
+
+    finally:
+        memory.MAX_POOL_MEMORY = max_pool_memory
+        memory.clear_pool()
@@ -0,0 +1,115 @@
+"""Test airfs._core.workers"""
+from threading import Event, Lock
+from time import sleep
+
+import pytest
+
+
+def test_worker_queue():
+    """Tests airfs._core.workers.WorkerQueue"""
+    from airfs._core.workers import WorkerQueue
+
+    # Test: Run task
+    queue = WorkerQueue("test_worker_queue")
+    assert queue.submit(sum, (1, 2)).result() == 3
+
+    # Test: Exceptions are set on future
+    with pytest.raises(ZeroDivisionError):
+        queue.submit(lambda: 1 / 0).result()
+
+    # Test: Tasks submitted from a worker run in this worker
+    assert queue.submit(lambda: queue.submit(sum, (1, 2)).result()).result() == 3
+
+
+def test_worker_queue_limits():
+    """Tests airfs._core.workers concurrency limits and fair queuing"""
+    import airfs._core.workers as workers
+
+    storage = "test_worker_queue_limits"
+    release = Event()
+    lock = Lock()
+    running = []
+    started = []
+    max_running = [0]
+
+    def task(name):
+        """Blocking task"""
+        with lock:
+            running.append(name)
+            started.append(name)
+            max_running[0] = max(max_running[0], len(running))
+        release.wait()
+        with lock:
+            running.remove(name)
+        return name
+
+    try:
+        # Test: Storage limit
+        workers.STORAGE_MAX_WORKERS[storage] = 2
+        queue1 = workers.WorkerQueue(storage)
+        queue2 = workers.WorkerQueue(storage)
+        futures = [queue1.submit(task, f"1-{index}") for index in range(4)]
+        futures += [queue2.submit(task, f"2-{index}") for index in range(4)]
+        sleep(0.05)
+        assert workers.running_tasks(storage) == 2
+        assert started == ["1-0", "1-1"]
+
+        # Test: Cancel pending task
+        assert futures[3].cancel()
+
+        release.set()
+        for future in futures:
+            if not future.cancelled():
+                future.result()
+        assert max_running[0] == 2
+        assert workers.running_tasks(storage) == 0
+        assert "1-3" not in started
+
+        # Test: Queues of the same storage are served in a round-robin order
+        release.clear()
+        started.clear()
+        workers.STORAGE_MAX_WORKERS[storage] = 1
+        blocking = workers.WorkerQueue(storage).submit(task, "0")
+        futures = [queue1.submit(task, f"1-{index}") for index in range(2)]
+        futures += [queue2.submit(task, f"2-{index}") for index in range(2)]
+        release.set()
+        blocking.result()
+        for future in futures:
+            future.result()
+        assert started == ["0", "1-0", "2-0", "1-1", "2-1"]
+
+        # Test: Queue limit
+        release.clear()
+        started.clear()
+        max_running[0] = 0
+        del workers.STORAGE_MAX_WORKERS[storage]
+        queue = workers.WorkerQueue(storage, max_workers=1)
+        futures = [queue.submit(task, index) for index in range(3)]
+        sleep(0.05)
+        assert len(started) == 1
+        release.set()
+        assert [future.result() for future in futures] == [0, 1, 2]
+        assert max_running[0] == 1
+
+    finally:
+        workers.STORAGE_MAX_WORKERS.pop(storage, None)
+        release.set()
+
+
+def test_shutdown():
+    """Tests airfs._core.workers.shutdown"""
+    import airfs._core.workers as workers
+
+    queue = workers.WorkerQueue("test_shutdown", max_workers=1)
+    release = Event()
+    running = queue.submit(release.wait)
+    pending = queue.submit(sum, (1, 2))
+    sleep(0.01)
+
+    release.set()
+    workers.shutdown(cancel_pending=True)
+    assert running.result()
+    assert pending.cancelled() or pending.result() == 3
+
+    # Test: Pool is created again on use
+    assert queue.submit(sum, (1, 2)).result() == 3
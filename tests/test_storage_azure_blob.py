@@ -269,6 +269,9 @@ def test_mocked_storage():
             container_name=None, blob_name=None, block=None, block_id=None, **_
         ):
             """azure.storage.blob.blockblobservice.BlockBlobService.put_block"""
+            if not isinstance(block, bytes):
+                # Only bytes and file-like objects are supported
+                block = block.read()
             storage_mock.put_object(
                 container_name, f"{blob_name}.{block_id}", content=block
             )
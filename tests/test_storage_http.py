@@ -105,6 +105,14 @@ def test_mocked_storage():
             if self.status_code >= 300:
                 raise HTTPError(self.reason, response=self)
 
+        def iter_content(self, chunk_size=1):
+            """Iterate over the content"""
+            for index in range(0, len(self.content), chunk_size):
+                yield self.content[index : index + chunk_size]
+
+        def close(self):
+            """Do nothing"""
+
     class Session:
         """Fake Session"""
 
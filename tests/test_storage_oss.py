@@ -94,6 +94,12 @@ def test_mocked_storage():
         is_truncated = False
         next_marker = ""
 
+    def _read_data(data):
+        """Read data like OSS SDK: Only bytes and file-like objects are supported"""
+        if isinstance(data, bytes):
+            return data
+        return data.read()
+
     class Bucket:
         """oss2.Bucket"""
 
@@ -117,7 +123,9 @@ def test_mocked_storage():
 
         def put_object(self, key=None, data=None, **_):
             """oss2.Bucket.put_object"""
-            storage_mock.put_object(self._bucket_name, key, data, new_file=True)
+            storage_mock.put_object(
+                self._bucket_name, key, _read_data(data), new_file=True
+            )
 
         def delete_object(self, key=None, **_):
             """oss2.Bucket.delete_object"""
@@ -192,7 +200,7 @@ def test_mocked_storage():
             return HeadObjectResult(
                 Response(
                     headers=storage_mock.put_object(
-                        self._bucket_name, key + str(part_number), data
+                        self._bucket_name, key + str(part_number), _read_data(data)
                     )
                 )
             )
@@ -97,6 +97,7 @@ def test_mocked_storage():
         @staticmethod
         def put_object(Bucket=None, Key=None, Body=None, **_):
             """boto3.client.put_object"""
+            assert isinstance(Body, (bytes, bytearray))
             storage_mock.put_object(Bucket, Key, Body, new_file=True)
 
         @staticmethod
@@ -181,6 +182,7 @@ def test_mocked_storage():
         ):
             """boto3.client.upload_part"""
             assert UploadId == 123
+            assert isinstance(Body, (bytes, bytearray))
             return storage_mock.put_object(Bucket, Key + str(PartNumber), Body)
 
         @staticmethod
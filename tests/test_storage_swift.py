@@ -91,12 +91,15 @@ def test_mocked_storage():
             return (URL,)
 
         @staticmethod
-        def get_object(container, obj, headers=None, **_):
+        def get_object(container, obj, headers=None, resp_chunk_size=None, **_):
             """swiftclient.client.Connection.get_object"""
-            return (
-                storage_mock.head_object(container, obj),
-                storage_mock.get_object(container, obj, header=headers),
-            )
+            content = storage_mock.get_object(container, obj, header=headers)
+            if resp_chunk_size:
+                return storage_mock.head_object(container, obj), (
+                    content[index : index + resp_chunk_size]
+                    for index in range(0, len(content), resp_chunk_size)
+                )
+            return storage_mock.head_object(container, obj), content
 
         @staticmethod
         def head_object(container, obj, **_):